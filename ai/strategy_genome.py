@@ -40,6 +40,8 @@ to them via a stateful ``generate_signal`` call.  They maintain internal
 state (price history) between calls.
 """
 
+import functools
+
 # ---------------------------------------------------------------------------
 # Parameter bounds
 # ---------------------------------------------------------------------------
@@ -106,7 +108,8 @@ def genome_to_strategy_class(genome: dict) -> type:
     Convert a genome dict into a concrete strategy class.
 
     The returned class exposes ``generate_signal(candle: dict) -> str``
-    and maintains internal price history.
+    and maintains internal price history.  Equal genomes map to the same
+    class object; all per-run state lives on instances.
 
     Parameters
     ----------
@@ -136,7 +139,14 @@ def genome_to_strategy_class(genome: dict) -> type:
 # ---------------------------------------------------------------------------
 # Strategy class builders
 # ---------------------------------------------------------------------------
+# Memoised on their parameters: evolution re-evaluates elites and repeated
+# offspring every generation, and building a class costs far more than the
+# lookup.  typed=True keeps e.g. 5 and 5.0 apart.
+
+_builder_cache = functools.lru_cache(maxsize=1024, typed=True)
+
 
+@_builder_cache
 def _make_ma_strategy(short: int, long_: int) -> type:
     """Moving average crossover strategy."""
 
@@ -175,6 +185,7 @@ def _make_ma_strategy(short: int, long_: int) -> type:
     return MovingAverageStrategy
 
 
+@_builder_cache
 def _make_rsi_strategy(period: int, overbought: int, oversold: int) -> type:
     """RSI-based mean-reversion strategy."""
 
@@ -221,6 +232,7 @@ def _make_rsi_strategy(period: int, overbought: int, oversold: int) -> type:
     return RSIStrategy
 
 
+@_builder_cache
 def _make_breakout_strategy(window: int) -> type:
     """Breakout strategy: BUY when price exceeds rolling high."""
 
@@ -102,8 +102,9 @@ class PortfolioAnalytics:
         window = min(_ROLLING_WINDOW, len(self._curve) - 1)
         window = max(window, 2)
 
-        rolling_sharpe = self._roll.rolling_sharpe(window)
-        rolling_vol    = self._roll.rolling_volatility(window)
+        rolling_sharpe, rolling_vol = (
+            self._roll.rolling_sharpe_and_volatility(window)
+        )
 
         # VaR
         var_95_hist  = None
@@ -67,21 +67,6 @@ class RollingMetrics:
             )
         return r
 
-    @staticmethod
-    def _sample_std(values: list) -> float:
-        n = len(values)
-        if n < 2:
-            return 0.0
-        mu = sum(values) / n
-        var = sum((x - mu) ** 2 for x in values) / (n - 1)
-        return math.sqrt(var)
-
-    @staticmethod
-    def _mean(values: list) -> float:
-        if not values:
-            return 0.0
-        return sum(values) / len(values)
-
     @staticmethod
     def _window_max_drawdown(equity_window: list) -> float:
         """Max drawdown within a sub-window of equity values."""
@@ -119,22 +104,7 @@ class RollingMetrics:
         ValueError
             If ``window`` < 2.
         """
-        if window < 2:
-            raise ValueError(f"window must be >= 2, got {window!r}")
-
-        returns = self._returns()
-        n = len(self._curve)
-        result = [None] * n
-
-        # returns[i] corresponds to equity_curve[i+1]
-        # A window of `window` returns requires equity indices [i, i+window]
-        # i.e. returns indices [i, i+window-1]
-        for i in range(window - 1, len(returns)):
-            w_returns = returns[i - window + 1 : i + 1]
-            vol = self._sample_std(w_returns) * math.sqrt(252)
-            result[i + 1] = vol  # align to equity_curve index
-
-        return result
+        return self.rolling_sharpe_and_volatility(window)[1]
 
     def rolling_sharpe(self, window: int) -> list:
         """
@@ -151,6 +121,21 @@ class RollingMetrics:
             Length equals ``len(equity_curve)``.  First ``window`` entries
             are ``None``; subsequent entries are floats (0.0 if vol == 0).
 
+        Raises
+        ------
+        ValueError
+            If ``window`` < 2.
+        """
+        return self.rolling_sharpe_and_volatility(window)[0]
+
+    def rolling_sharpe_and_volatility(self, window: int) -> tuple:
+        """
+        ``(rolling_sharpe(window), rolling_volatility(window))`` in a
+        single pass.
+
+        Both metrics are built from the same windows of returns, so each
+        window's mean and standard deviation are computed once and shared.
+
         Raises
         ------
         ValueError
@@ -161,16 +146,22 @@ class RollingMetrics:
 
         returns = self._returns()
         n = len(self._curve)
-        result = [None] * n
+        sharpe_result = [None] * n
+        vol_result = [None] * n
+        annualise = math.sqrt(252)
 
+        # returns[i] corresponds to equity_curve[i+1]
+        # A window of `window` returns requires equity indices [i, i+window]
+        # i.e. returns indices [i, i+window-1]
         for i in range(window - 1, len(returns)):
             w_returns = returns[i - window + 1 : i + 1]
-            mu = self._mean(w_returns) * 252
-            vol = self._sample_std(w_returns) * math.sqrt(252)
-            sharpe = 0.0 if vol == 0.0 else mu / vol
-            result[i + 1] = sharpe
+            mu = sum(w_returns) / window
+            var = sum((x - mu) ** 2 for x in w_returns) / (window - 1)
+            vol = math.sqrt(var) * annualise
+            vol_result[i + 1] = vol  # align to equity_curve index
+            sharpe_result[i + 1] = 0.0 if vol == 0.0 else mu * 252 / vol
 
-        return result
+        return sharpe_result, vol_result
 
     def rolling_max_drawdown(self, window: int) -> list:
         """
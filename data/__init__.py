@@ -9,5 +9,6 @@ Modules
 data_provider           — Abstract MarketDataProvider interface.
 yahoo_provider          — YahooProvider: free HTTP-based data from Yahoo Finance.
 alpha_vantage_provider  — AlphaVantageProvider: Alpha Vantage API (free tier).
-cache                   — JSONFileCache: simple file-based response cache.
+cache                   — JSONFileCache: simple file-based response cache;
+                          MemoryTieredCache: in-memory LRU tier on top.
 """
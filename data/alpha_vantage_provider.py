@@ -19,6 +19,7 @@ Free tier limits: 25 requests/day, 5 requests/minute.
 """
 
 import json
+import operator
 import os
 import urllib.request
 import urllib.error
@@ -28,7 +29,8 @@ from data.cache import JSONFileCache
 
 _BASE_URL = "https://www.alphavantage.co/query"
 
-_INTRADAY_INTERVALS = {"1min", "5min", "15min", "30min", "60min"}
+_INTRADAY_INTERVALS_SORTED = ("1min", "5min", "15min", "30min", "60min")
+_INTRADAY_INTERVALS = frozenset(_INTRADAY_INTERVALS_SORTED)
 
 
 class AlphaVantageProvider(MarketDataProvider):
@@ -133,7 +135,7 @@ class AlphaVantageProvider(MarketDataProvider):
         else:
             raise ValueError(
                 f"Unsupported interval {interval!r}. "
-                f"Use '1d' or one of {sorted(_INTRADAY_INTERVALS)}."
+                f"Use '1d' or one of {list(_INTRADAY_INTERVALS_SORTED)}."
             )
 
         url = _BASE_URL + params
@@ -172,22 +174,36 @@ class AlphaVantageProvider(MarketDataProvider):
         series = data[ts_key]
         candles = []
 
+        # DAILY_ADJUSTED reports volume as field 6; INTRADAY as field 5.
+        volume_key = "6. volume" if interval == "1d" else "5. volume"
+
+        # On a newest-first series everything after the first entry older
+        # than *start* is out of range too, so stop scanning there.
+        keys = iter(series)
+        newest_first = next(keys, "") > next(keys, "")
+
         for date_str, values in series.items():
             day = date_str[:10]  # "YYYY-MM-DD"
-            if day < start or day > end:
+            if day < start:
+                if newest_first:
+                    break
+                continue
+            if day > end:
                 continue
             try:
                 candles.append({
                     "timestamp": day,
-                    "open":   float(values.get("1. open",   values.get("1. open", 0))),
-                    "high":   float(values.get("2. high",   values.get("2. high", 0))),
-                    "low":    float(values.get("3. low",    values.get("3. low",  0))),
-                    "close":  float(values.get("4. close",  values.get("4. close", 0))),
-                    "volume": float(values.get("6. volume", values.get("5. volume", 0))),
+                    "open":   float(values["1. open"]),
+                    "high":   float(values["2. high"]),
+                    "low":    float(values["3. low"]),
+                    "close":  float(values["4. close"]),
+                    "volume": float(values[volume_key]),
                 })
             except (KeyError, ValueError):
                 continue
 
-        # Sort chronologically
-        candles.sort(key=lambda c: c["timestamp"])
+        # Sort chronologically.  Alpha Vantage emits newest-first; timsort
+        # handles an already-monotone run in O(n), and the stable sort keeps
+        # the feed's order among bars sharing a timestamp.
+        candles.sort(key=operator.itemgetter("timestamp"))
         return candles
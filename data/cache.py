@@ -7,6 +7,10 @@ Simple JSON file-based cache for market data responses.
 Cache keys are derived from a hash of (symbol, start, end, interval).
 Cached data is stored as JSON files in a configurable directory.
 
+:class:`MemoryTieredCache` adds a bounded in-memory LRU tier on top of the
+file cache so that repeated hits on the same key skip both the file read
+and the JSON parse.
+
 Usage
 -----
     cache = JSONFileCache(cache_dir=".market_cache")
@@ -21,6 +25,8 @@ Usage
 import hashlib
 import json
 import os
+import threading
+from collections import OrderedDict
 
 
 class JSONFileCache:
@@ -103,3 +109,91 @@ class JSONFileCache:
         for fname in os.listdir(self._cache_dir):
             if fname.endswith(".json"):
                 os.remove(os.path.join(self._cache_dir, fname))
+
+
+class MemoryTieredCache(JSONFileCache):
+    """
+    :class:`JSONFileCache` with a bounded in-memory LRU tier.
+
+    Lookups check memory first and fall back to the file cache; entries
+    read from disk are promoted into memory.  ``set`` writes through to
+    disk and ``clear`` / ``clear_all`` invalidate both tiers.
+
+    Values returned from the memory tier are shared between callers and
+    must be treated as read-only.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        Directory where cache files are stored.  Default ``".market_cache"``.
+    max_entries : int, optional
+        Maximum number of entries held in memory.  Least recently used
+        entries are evicted first.  Default 256.
+
+    Raises
+    ------
+    ValueError
+        If *max_entries* < 1.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = ".market_cache",
+        max_entries: int = 256,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        super().__init__(cache_dir=cache_dir)
+        self._max_entries = max_entries
+        self._memory: OrderedDict = OrderedDict()
+        # Guards the LRU bookkeeping when providers fetch in batch threads.
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+
+    def _remember(self, key: str, data: list) -> None:
+        memory = self._memory
+        with self._lock:
+            memory[key] = data
+            memory.move_to_end(key)
+            if len(memory) > self._max_entries:
+                memory.popitem(last=False)
+
+    def has(self, key: str) -> bool:
+        """Return ``True`` if *key* is present in memory or on disk."""
+        return key in self._memory or super().has(key)
+
+    def get(self, key: str) -> list:
+        """
+        Retrieve cached data for *key*, preferring the memory tier.
+
+        Raises
+        ------
+        KeyError
+            If *key* is not in the cache.
+        """
+        memory = self._memory
+        with self._lock:
+            if key in memory:
+                memory.move_to_end(key)
+                return memory[key]
+        data = super().get(key)
+        self._remember(key, data)
+        return data
+
+    def set(self, key: str, data: list) -> None:
+        """Store *data* under *key* on disk and in memory."""
+        super().set(key, data)
+        self._remember(key, data)
+
+    def clear(self, key: str) -> None:
+        """Remove a single cache entry from both tiers."""
+        with self._lock:
+            self._memory.pop(key, None)
+        super().clear(key)
+
+    def clear_all(self) -> None:
+        """Remove all cache entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        super().clear_all()
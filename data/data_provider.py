@@ -21,6 +21,10 @@ Each candle dict must contain:
     }
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+_MAX_BATCH_WORKERS = 16
+
 
 class MarketDataProvider:
     """
@@ -64,3 +68,48 @@ class MarketDataProvider:
         raise NotImplementedError(
             f"{type(self).__name__} must implement get_historical()"
         )
+
+    def get_historical_batch(
+        self,
+        symbols: list,
+        start: str,
+        end: str,
+        interval: str = "1d",
+        max_workers: int = _MAX_BATCH_WORKERS,
+    ) -> dict:
+        """
+        Fetch historical candles for several symbols concurrently.
+
+        Each symbol is fetched via :meth:`get_historical` on a worker
+        thread; HTTP reads release the GIL so a watchlist completes in
+        roughly one round-trip instead of one per symbol.
+
+        Parameters
+        ----------
+        symbols : list[str]
+            Ticker symbols to fetch.
+        start, end, interval :
+            Passed through to :meth:`get_historical`.
+        max_workers : int, optional
+            Upper bound on worker threads.  Default 16.
+
+        Returns
+        -------
+        dict[str, list[dict]]
+            Mapping of symbol to its candles, in the order of *symbols*.
+
+        Raises
+        ------
+        RuntimeError
+            Propagated from the first failing :meth:`get_historical` call.
+        """
+        symbols = list(symbols)
+        if not symbols:
+            return {}
+        workers = min(max_workers, len(symbols))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(
+                lambda s: self.get_historical(s, start, end, interval),
+                symbols,
+            )
+            return dict(zip(symbols, results))
@@ -27,21 +27,27 @@ import json
 import time
 import urllib.request
 import urllib.error
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from functools import lru_cache
 
 from data.data_provider import MarketDataProvider
 from data.cache import JSONFileCache
 
 
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_SECONDS_PER_DAY = 86400
+
+
+@lru_cache(maxsize=1024)
 def _to_unix(date_str: str) -> int:
     """Convert 'YYYY-MM-DD' to Unix timestamp (UTC midnight)."""
-    dt = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    dt = datetime.fromisoformat(date_str).replace(tzinfo=timezone.utc)
     return int(dt.timestamp())
 
 
 def _from_unix(ts: int) -> str:
-    """Convert Unix timestamp to 'YYYY-MM-DD' string."""
-    return datetime.utcfromtimestamp(ts).strftime("%Y-%m-%d")
+    """Convert Unix timestamp to 'YYYY-MM-DD' string (UTC)."""
+    return date.fromordinal(_EPOCH_ORDINAL + int(ts) // _SECONDS_PER_DAY).isoformat()
 
 
 class YahooProvider(MarketDataProvider):
@@ -112,7 +118,7 @@ class YahooProvider(MarketDataProvider):
 
     def _fetch(self, symbol: str, start: str, end: str, interval: str) -> list:
         period1 = _to_unix(start)
-        period2 = _to_unix(end) + 86400  # include end date
+        period2 = _to_unix(end) + _SECONDS_PER_DAY  # include end date
 
         url = (
             self._BASE_URL.format(symbol=symbol)
@@ -7,6 +7,10 @@ Abstract base class for all broker implementations.
 Any concrete broker (paper, live, simulated) must subclass
 :class:`BrokerInterface` and implement :meth:`execute_order`.
 
+:meth:`execute_market` is an order-free convenience entry point used on
+paths that need no audit trail or risk adjustment.  Its default wraps the
+arguments in an :class:`Order`; brokers may override it to skip that.
+
 Usage
 -----
     class MyBroker(BrokerInterface):
@@ -46,3 +50,16 @@ class BrokerInterface:
         raise NotImplementedError(
             f"{type(self).__name__} must implement execute_order()"
         )
+
+    def execute_market(self, side: str, quantity: float, price: float) -> Fill:
+        """
+        Execute *quantity* shares on *side* at reference *price*.
+
+        The default builds an :class:`Order` and delegates to
+        :meth:`execute_order`.
+
+        Returns
+        -------
+        Fill
+        """
+        return self.execute_order(Order(side=side, quantity=quantity, price=price))
@@ -45,9 +45,27 @@ Validation
   → ``ValueError`` for any other value
 * Input list is never mutated.
 * Returned weights always sum to 1.0 (within floating-point precision).
+
+Caching
+-------
+Weights for the most recent distinct inputs are memoised, keyed by the
+``(strategy_name, metric)`` pairs the active mode reads.  Repeat
+rebalances over unchanged rankings return a fresh copy of the cached
+weights without recomputing them.
 """
 
-_VALID_MODES = frozenset({"equal", "sharpe", "robustness"})
+from enum import StrEnum
+
+
+class AllocationMode(StrEnum):
+    """Supported weighting modes.  Members compare equal to their strings."""
+
+    EQUAL = "equal"
+    SHARPE = "sharpe"
+    ROBUSTNESS = "robustness"
+
+
+_CACHE_SIZE = 32
 
 
 class CapitalAllocator:
@@ -67,16 +85,23 @@ class CapitalAllocator:
     """
 
     def __init__(self, mode: str = "equal") -> None:
-        if mode not in _VALID_MODES:
+        try:
+            self._mode = AllocationMode(mode)
+        except ValueError:
             raise ValueError(
-                f"mode must be one of {sorted(_VALID_MODES)}, got {mode!r}"
-            )
-        self._mode = mode
+                f"mode must be one of {[m.value for m in AllocationMode]}, "
+                f"got {mode!r}"
+            ) from None
+        # Fingerprint -> weights; insertion order doubles as eviction order.
+        self._cache: dict = {}
+        # Strategy-name tuple -> equal-weight dict, shared by the "equal"
+        # mode and the all-non-positive fallback of the metric modes.
+        self._equal_cache: dict = {}
 
     # ------------------------------------------------------------------
 
     @property
-    def mode(self) -> str:
+    def mode(self) -> AllocationMode:
         return self._mode
 
     # ------------------------------------------------------------------
@@ -105,61 +130,66 @@ class CapitalAllocator:
         if not ranking_results:
             raise ValueError("ranking_results must not be empty")
 
-        if self._mode == "equal":
-            return self._equal_weights(ranking_results)
-        elif self._mode == "sharpe":
-            return self._sharpe_weights(ranking_results)
+        key = self._fingerprint(ranking_results)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        if self._mode is AllocationMode.EQUAL:
+            weights = self._equal_weights(ranking_results)
+        elif self._mode is AllocationMode.SHARPE:
+            weights = self._sharpe_weights(ranking_results)
         else:  # robustness
-            return self._robustness_weights(ranking_results)
+            weights = self._robustness_weights(ranking_results)
+
+        if len(self._cache) >= _CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = weights
+        return dict(weights)
 
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _equal_weights(results: list) -> dict:
-        n = len(results)
-        w = 1.0 / n
-        return {r["strategy_name"]: w for r in results}
-
-    @staticmethod
-    def _sharpe_weights(results: list) -> dict:
-        sharpes = {
-            r["strategy_name"]: r["backtest"]["sharpe_ratio"]
-            for r in results
-        }
-        positive = {name: v for name, v in sharpes.items() if v > 0}
+    def _fingerprint(self, results: list) -> tuple:
+        if self._mode is AllocationMode.EQUAL:
+            return tuple(r["strategy_name"] for r in results)
+        if self._mode is AllocationMode.SHARPE:
+            return tuple(
+                (r["strategy_name"], r["backtest"]["sharpe_ratio"])
+                for r in results
+            )
+        return tuple((r["strategy_name"], r["robustness"]) for r in results)
+
+    def _equal_weights(self, results: list) -> dict:
+        names = tuple(r["strategy_name"] for r in results)
+        weights = self._equal_cache.get(names)
+        if weights is None:
+            w = 1.0 / len(names)
+            weights = {name: w for name in names}
+            if len(self._equal_cache) >= _CACHE_SIZE:
+                del self._equal_cache[next(iter(self._equal_cache))]
+            self._equal_cache[names] = weights
+        return weights
 
-        if not positive:
-            # Fallback to equal
-            n = len(results)
-            return {r["strategy_name"]: 1.0 / n for r in results}
+    def _sharpe_weights(self, results: list) -> dict:
+        return self._metric_weights(
+            results, lambda r: r["backtest"]["sharpe_ratio"]
+        )
 
-        total = sum(positive.values())
-        weights = {}
-        for r in results:
-            name = r["strategy_name"]
-            weights[name] = positive[name] / total if name in positive else 0.0
+    def _robustness_weights(self, results: list) -> dict:
+        return self._metric_weights(results, lambda r: r["robustness"])
 
-        return weights
+    def _metric_weights(self, results: list, metric) -> dict:
+        """Weights proportional to the positive part of ``metric(result)``."""
+        values = {r["strategy_name"]: metric(r) for r in results}
+        total = sum(v for v in values.values() if v > 0)
 
-    @staticmethod
-    def _robustness_weights(results: list) -> dict:
-        robustness = {
-            r["strategy_name"]: r["robustness"]
-            for r in results
-        }
-        positive = {name: v for name, v in robustness.items() if v > 0}
-
-        if not positive:
+        if total <= 0:
             # Fallback to equal
-            n = len(results)
-            return {r["strategy_name"]: 1.0 / n for r in results}
-
-        total = sum(positive.values())
-        weights = {}
-        for r in results:
-            name = r["strategy_name"]
-            weights[name] = positive[name] / total if name in positive else 0.0
+            return self._equal_weights(results)
 
-        return weights
+        return {
+            name: (v / total if v > 0 else 0.0)
+            for name, v in values.items()
+        }
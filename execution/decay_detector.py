@@ -13,6 +13,8 @@ Usage
     if detector.is_decayed(ranking_result):
         ...  # disable this strategy
 
+    flags = detector.filter_decayed(ranking_results)  # one bool per result
+
 Supported metrics
 -----------------
 sharpe
@@ -28,7 +30,22 @@ Validation
 * Deterministic.
 """
 
-_VALID_METRICS = frozenset({"sharpe", "robustness"})
+from enum import StrEnum
+
+
+class DecayMetric(StrEnum):
+    """Supported decay metrics.  Members compare equal to their strings."""
+
+    SHARPE = "sharpe"
+    ROBUSTNESS = "robustness"
+
+
+def _sharpe_of(result: dict) -> float:
+    return result["backtest"]["sharpe_ratio"]
+
+
+def _robustness_of(result: dict) -> float:
+    return result["robustness"]
 
 
 class PerformanceDecayDetector:
@@ -51,13 +68,18 @@ class PerformanceDecayDetector:
     """
 
     def __init__(self, threshold: float, metric: str = "sharpe") -> None:
-        if metric not in _VALID_METRICS:
+        try:
+            self._metric = DecayMetric(metric)
+        except ValueError:
             raise ValueError(
-                f"metric must be one of {sorted(_VALID_METRICS)}, "
+                f"metric must be one of {[m.value for m in DecayMetric]}, "
                 f"got {metric!r}"
-            )
+            ) from None
         self._threshold = float(threshold)
-        self._metric = metric
+        if self._metric is DecayMetric.SHARPE:
+            self._value_of = _sharpe_of
+        else:  # robustness
+            self._value_of = _robustness_of
 
     # ------------------------------------------------------------------
 
@@ -66,7 +88,7 @@ class PerformanceDecayDetector:
         return self._threshold
 
     @property
-    def metric(self) -> str:
+    def metric(self) -> DecayMetric:
         return self._metric
 
     # ------------------------------------------------------------------
@@ -87,9 +109,25 @@ class PerformanceDecayDetector:
         bool
             ``True`` when ``metric_value < threshold``.
         """
-        if self._metric == "sharpe":
-            value = ranking_result["backtest"]["sharpe_ratio"]
-        else:  # robustness
-            value = ranking_result["robustness"]
+        return self._value_of(ranking_result) < self._threshold
 
-        return value < self._threshold
+    def filter_decayed(self, ranking_results: list) -> list:
+        """
+        Evaluate :meth:`is_decayed` for a batch of results.
+
+        The metric extractor and threshold are resolved once for the
+        whole batch rather than per strategy.
+
+        Parameters
+        ----------
+        ranking_results : list[dict]
+            Entries from ``StrategyRankingEngine.run()``.  Not mutated.
+
+        Returns
+        -------
+        list[bool]
+            One flag per input, in order; ``True`` when decayed.
+        """
+        value_of = self._value_of
+        threshold = self._threshold
+        return [value_of(r) < threshold for r in ranking_results]
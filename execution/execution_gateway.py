@@ -47,8 +47,34 @@ Validation
 * Input candles are never mutated.
 """
 
+import sys
+from array import array
+from types import MappingProxyType
+
 from execution.broker_interface import BrokerInterface
-from execution.order import Order, BUY, SELL
+from execution.order import BUY, SELL
+
+# Side codes stored in the structure-of-arrays trade log.
+_SIDE_CODES = {BUY: 0, SELL: 1}
+_SIDE_NAMES = (BUY, SELL)
+
+# Gateway position states.  Only ever assigned from these constants.
+_FLAT = sys.intern("FLAT")
+_LONG = sys.intern("LONG")
+
+# The one signal that triggers a trade from each state.
+_TRIGGERS = {_FLAT: BUY, _LONG: SELL}
+
+
+def _with_closes(candles):
+    """Yield ``(candle, float(close))`` pairs, validating each candle."""
+    for candle in candles:
+        try:
+            close = candle["close"]
+        except KeyError:
+            raise KeyError("candle must contain the key 'close'") from None
+        # Closes parsed from JSON/CSV are usually floats already.
+        yield candle, (close if close.__class__ is float else float(close))
 
 
 class ExecutionGateway:
@@ -65,6 +91,17 @@ class ExecutionGateway:
     risk_manager : RiskManager or None, optional
         If provided, BUY order quantities are capped before execution.
         Default ``None`` (no risk management).
+    compact_equity_curve : bool, optional
+        If ``True``, the equity curve is stored as single-precision
+        (float32) values, halving its memory for long simulations.  Cash
+        and position accounting stay in double precision; only the
+        recorded curve is rounded, so upcast-sensitive consumers should
+        leave this off.  Default ``False``.
+    record_trades : bool, optional
+        If ``False``, executed trades are only counted (see
+        :attr:`trade_count`) and ``get_state()["trade_history"]`` stays
+        empty.  For callers that only need the equity curve.  Default
+        ``True``.
     """
 
     def __init__(
@@ -72,23 +109,163 @@ class ExecutionGateway:
         strategy_class: type,
         broker: BrokerInterface,
         risk_manager=None,
+        compact_equity_curve: bool = False,
+        record_trades: bool = True,
     ) -> None:
+        self._strategy_class = strategy_class
         self._strategy = strategy_class()
         self._broker = broker
         self._risk_manager = risk_manager
 
         # Gateway-level state (broker owns cash/position)
-        self._state: str = "FLAT"          # "FLAT" | "LONG"
+        self._state: str = _FLAT           # _FLAT | _LONG
         self._current_price: float = 0.0
+        # Mark-to-market equity at _current_price, refreshed once per
+        # candle so get_state() does not recompute it.
+        self._equity_val: float = self._equity(0.0)
+
+        # (signal, state) -> (handler, next_state).  Any other pair, i.e.
+        # HOLD or a redundant signal, misses and is a no-op.  The BUY
+        # handler is specialised here so the trade path never re-checks
+        # whether a risk manager is configured.
+        buy = self._buy if risk_manager is None else self._buy_capped
+        self._dispatch: dict = {
+            (BUY, _FLAT):  (buy, _LONG),
+            (SELL, _LONG): (self._sell, _FLAT),
+        }
 
-        self._equity_curve: list = []
-        self._trade_history: list = []
+        # Equity curve and trade log are kept as typed columns (SoA) rather
+        # than a list of per-trade dicts; get_state() builds the dict view.
+        self._equity_curve = array("f" if compact_equity_curve else "d")
+        # Number of filled slots; the curve may hold reserved capacity
+        # beyond this (see reserve()).
+        self._equity_len: int = 0
+        self._trade_side = array("b")
+        self._trade_price = array("d")
+        self._trade_shares = array("d")
+        self._trade_cash = array("d")
+        # Read-only per-trade views handed out by get_state(); extended
+        # lazily as new trades are recorded.
+        self._trade_views: list = []
+        self._trade_history_view: tuple = ()
+        # Trades executed but not logged (record_trades=False).
+        self._unlogged_trades: int = 0
+        if not record_trades:
+            self._record_trade = self._count_trade
+
+    # ------------------------------------------------------------------
+    def reset(self) -> None:
+        """
+        Return to the freshly constructed state.
+
+        A new strategy instance is created and the equity curve and trade
+        log are cleared; their buffers are kept for reuse.  The broker is
+        not touched — reset it first so the initial equity is correct.
+        """
+        self._strategy = self._strategy_class()
+        self._state = _FLAT
+        self._current_price = 0.0
+        self._equity_val = self._equity(0.0)
+        self._equity_len = 0
+        del self._trade_side[:]
+        del self._trade_price[:]
+        del self._trade_shares[:]
+        del self._trade_cash[:]
+        self._trade_views = []
+        self._trade_history_view = ()
+        self._unlogged_trades = 0
 
     # ------------------------------------------------------------------
     def _equity(self, price: float) -> float:
         """Mark-to-market equity at *price*."""
         return self._broker.cash + self._broker.position_size * price
 
+    # ------------------------------------------------------------------
+    def reserve(self, n: int) -> None:
+        """
+        Preallocate room for *n* more equity-curve points.
+
+        Callers that know the candle count up front (e.g.
+        :class:`MarketLoop`) call this once so the per-candle path writes
+        into an existing slot instead of growing the buffer.
+        """
+        spare = len(self._equity_curve) - self._equity_len
+        if n > spare:
+            self._equity_curve.frombytes(
+                bytes((n - spare) * self._equity_curve.itemsize)
+            )
+
+    @property
+    def equity_points(self) -> int:
+        """Number of equity-curve points recorded so far."""
+        return self._equity_len
+
+    def equity_curve_since(self, start: int = 0) -> array:
+        """Return the equity-curve points recorded from index *start* on."""
+        return self._equity_curve[start:self._equity_len]
+
+    @property
+    def trade_count(self) -> int:
+        """Number of trades executed, whether or not they were logged."""
+        return len(self._trade_side) + self._unlogged_trades
+
+    # ------------------------------------------------------------------
+    def _record_trade(self, side: str, fill) -> None:
+        """Append a *side* trade filled by *fill* to the trade log."""
+        self._trade_side.append(_SIDE_CODES[side])
+        self._trade_price.append(fill.price)
+        self._trade_shares.append(fill.quantity)
+        self._trade_cash.append(self._broker.cash)
+
+    def _count_trade(self, side: str, fill) -> None:
+        """``_record_trade`` replacement used when trades are not logged."""
+        self._unlogged_trades += 1
+
+    def _trade_history(self) -> tuple:
+        """
+        Return the trade log as a tuple of read-only per-trade mappings.
+
+        Trades are append-only, so only trades recorded since the previous
+        call are materialised and the tuple is rebuilt only when the trade
+        count has changed.
+        """
+        views = self._trade_views
+        n_trades = len(self._trade_side)
+        if len(views) == n_trades:
+            return self._trade_history_view
+
+        for i in range(len(views), n_trades):
+            views.append(MappingProxyType({
+                "type":       _SIDE_NAMES[self._trade_side[i]],
+                "price":      self._trade_price[i],
+                "shares":     self._trade_shares[i],
+                "cash_after": self._trade_cash[i],
+            }))
+        self._trade_history_view = tuple(views)
+        return self._trade_history_view
+
+    # ------------------------------------------------------------------
+    def _buy(self, price: float) -> None:
+        """All-in BUY at *price*."""
+        broker = self._broker
+        fill = broker.execute_market(BUY, broker.cash / price, price)
+        self._record_trade(BUY, fill)
+
+    def _buy_capped(self, price: float) -> None:
+        """All-in BUY at *price*, capped by the risk manager."""
+        broker = self._broker
+        quantity = self._risk_manager.adjust_buy_qty(
+            broker.cash / price, price, self._equity(price)
+        )
+        fill = broker.execute_market(BUY, quantity, price)
+        self._record_trade(BUY, fill)
+
+    def _sell(self, price: float) -> None:
+        """Close the full position at *price*."""
+        broker = self._broker
+        fill = broker.execute_market(SELL, broker.position_size, price)
+        self._record_trade(SELL, fill)
+
     # ------------------------------------------------------------------
     def on_candle(self, candle: dict) -> None:
         """
@@ -104,50 +281,176 @@ class ExecutionGateway:
         KeyError
             If ``candle`` does not contain ``"close"``.
         """
-        if "close" not in candle:
-            raise KeyError("candle must contain the key 'close'")
-
-        price = float(candle["close"])
+        try:
+            price = candle["close"]
+        except KeyError:
+            raise KeyError("candle must contain the key 'close'") from None
+        if price.__class__ is not float:
+            price = float(price)
         self._current_price = price
 
         signal = self._strategy.generate_signal(candle)
 
-        if signal == BUY and self._state == "FLAT":
-            # All-in: buy as many shares as cash allows
-            quantity = self._broker.cash / price
-            order = Order(side=BUY, quantity=quantity, price=price)
-
-            # Apply risk manager if present
-            if self._risk_manager is not None:
-                equity = self._equity(price)
-                order = self._risk_manager.adjust_order(order, equity)
-
-            fill = self._broker.execute_order(order)
-            self._state = "LONG"
-            self._trade_history.append({
-                "type":       "BUY",
-                "price":      fill.price,
-                "shares":     fill.quantity,
-                "cash_after": self._broker.cash,
-            })
-
-        elif signal == SELL and self._state == "LONG":
-            # Close full position
-            quantity = self._broker.position_size
-            order = Order(side=SELL, quantity=quantity, price=price)
-            fill = self._broker.execute_order(order)
-            self._state = "FLAT"
-            self._trade_history.append({
-                "type":       "SELL",
-                "price":      fill.price,
-                "shares":     fill.quantity,
-                "cash_after": self._broker.cash,
-            })
-
-        # HOLD or redundant signal → no action
+        transition = self._dispatch.get((signal, self._state))
+        if transition is not None:
+            handler, next_state = transition
+            handler(price)
+            self._state = next_state
 
         # Always update equity curve
-        self._equity_curve.append(self._equity(price))
+        broker = self._broker
+        equity = broker.cash + broker.position_size * price
+        i = self._equity_len
+        if i < len(self._equity_curve):
+            self._equity_curve[i] = equity
+        else:
+            self._equity_curve.append(equity)
+        self._equity_len = i + 1
+        self._equity_val = equity
+
+    # ------------------------------------------------------------------
+    def run_batch(self, candles, closes=None) -> None:
+        """
+        Process *candles* in order; equivalent to calling :meth:`on_candle`
+        for each one.
+
+        Attribute and method lookups are hoisted into locals once per batch,
+        which keeps the per-candle HOLD path to a signal call, one transition
+        table lookup and one equity append.
+
+        Parameters
+        ----------
+        candles : iterable of dict
+            Each must contain at least ``"close"``.  Not mutated.
+        closes : iterable of float, optional
+            Close prices already extracted from *candles* (same order and
+            length).  When given, the per-candle ``"close"`` check and
+            lookup are skipped.
+
+        Raises
+        ------
+        KeyError
+            If a candle does not contain ``"close"``.  Candles before it
+            have already been processed.
+        """
+        broker = self._broker
+        generate_signal = self._strategy.generate_signal
+        lookup_transition = self._dispatch.get
+        curve = self._equity_curve
+        append_equity = curve.append
+        n_filled = self._equity_len
+        capacity = len(curve)
+
+        if closes is None:
+            priced = _with_closes(candles)
+        else:
+            priced = zip(candles, closes)
+
+        state = self._state
+        price = self._current_price
+        # Cash and position only change when a trade executes, so they are
+        # re-read from the broker after trades rather than on every candle.
+        cash = broker.cash
+        position = broker.position_size
+        try:
+            for candle, price in priced:
+                signal = generate_signal(candle)
+
+                transition = lookup_transition((signal, state))
+                if transition is not None:
+                    handler, next_state = transition
+                    handler(price)
+                    state = next_state
+                    cash = broker.cash
+                    position = broker.position_size
+
+                equity = cash + position * price
+                if n_filled < capacity:
+                    curve[n_filled] = equity
+                else:
+                    append_equity(equity)
+                n_filled += 1
+        finally:
+            self._state = state
+            self._current_price = price
+            self._equity_len = n_filled
+            self._equity_val = broker.cash + broker.position_size * price
+
+    # ------------------------------------------------------------------
+    def run_vectorized(self, candles, closes=None) -> None:
+        """
+        Process *candles* with the same result as :meth:`run_batch`, but
+        generate every signal before executing any of them.
+
+        A strategy sees only the candle stream, never its own fills, so its
+        signals do not depend on execution.  With all signals known, the
+        next trade is found with ``list.index`` and the equity for each
+        run of candles between trades is filled in by one comprehension
+        instead of a per-candle loop body.
+
+        Parameters
+        ----------
+        candles, closes
+            As for :meth:`run_batch`.
+
+        Raises
+        ------
+        KeyError
+            If a candle does not contain ``"close"``; nothing is processed.
+        """
+        # Candles are walked twice (closes, then signals), so a one-shot
+        # iterator has to be materialised first.
+        if not isinstance(candles, (list, tuple)):
+            candles = list(candles)
+        if closes is None:
+            closes = [price for _, price in _with_closes(candles)]
+        elif not isinstance(closes, list):
+            closes = list(closes)
+        signals = list(map(self._strategy.generate_signal, candles))
+
+        broker = self._broker
+        dispatch = self._dispatch
+        n = len(signals)
+        equity: list = []
+
+        state = self._state
+        i = 0
+        try:
+            while i < n:
+                trigger = _TRIGGERS[state]
+                try:
+                    j = signals.index(trigger, i)
+                except ValueError:
+                    j = n
+                cash = broker.cash
+                position = broker.position_size
+                if position == 0.0:
+                    # A flat book is worth its cash at any price.
+                    equity += [cash] * (j - i)
+                else:
+                    equity += [cash + position * p for p in closes[i:j]]
+                if j == n:
+                    break
+
+                price = closes[j]
+                handler, next_state = dispatch[(trigger, state)]
+                handler(price)
+                state = next_state
+                equity.append(broker.cash + broker.position_size * price)
+                i = j + 1
+        finally:
+            start = self._equity_len
+            filled = len(equity)
+            self.reserve(filled)
+            curve = self._equity_curve
+            curve[start:start + filled] = array(curve.typecode, equity)
+            self._equity_len = start + filled
+            self._state = state
+            if filled:
+                self._current_price = closes[filled - 1]
+            self._equity_val = (
+                broker.cash + broker.position_size * self._current_price
+            )
 
     # ------------------------------------------------------------------
     def get_state(self) -> dict:
@@ -161,15 +464,15 @@ class ExecutionGateway:
             position_size : float
             equity        : float
             equity_curve  : list[float]
-            trade_history : list[dict]
+            trade_history : tuple[Mapping]  (read-only; shared between
+                            calls until the next trade)
             state         : str  ("FLAT" or "LONG")
         """
-        current_equity = self._equity(self._current_price)
         return {
             "cash":          self._broker.cash,
             "position_size": self._broker.position_size,
-            "equity":        current_equity,
-            "equity_curve":  list(self._equity_curve),
-            "trade_history": [dict(t) for t in self._trade_history],
+            "equity":        self._equity_val,
+            "equity_curve":  self._equity_curve[:self._equity_len].tolist(),
+            "trade_history": self._trade_history(),
             "state":         self._state,
         }
@@ -14,17 +14,28 @@ Classes
 Order  — represents an instruction to buy or sell a quantity at a price.
 Fill   — represents the result of executing an Order.
 
-Both classes are immutable after construction: attribute reassignment raises
-``AttributeError``.
+Both classes are immutable after construction: attribute reassignment or
+deletion raises ``AttributeError``.
+
+Order ids are drawn from a process-wide monotonic counter and rendered as
+``"order-<n>"`` on access, which avoids a UUID4 draw per order.
 """
 
-import uuid
+import itertools
+import sys
+
+_next_order_id = itertools.count(1).__next__
+
+# Bypasses the immutability guards below during construction.
+_set = object.__setattr__
 
 # ---------------------------------------------------------------------------
 # Side constants
 # ---------------------------------------------------------------------------
-BUY  = "BUY"
-SELL = "SELL"
+# Interned so that equality checks against signal literals hit CPython's
+# identity fast path.
+BUY  = sys.intern("BUY")
+SELL = sys.intern("SELL")
 
 
 # ---------------------------------------------------------------------------
@@ -49,7 +60,7 @@ class Order:
     Attributes
     ----------
     id : str
-        UUID4 string, unique per instance.
+        ``"order-<n>"`` string, unique per instance within the process.
     side, quantity, price, timestamp : as above.
 
     Notes
@@ -57,7 +68,7 @@ class Order:
     Instances are immutable — attribute reassignment raises ``AttributeError``.
     """
 
-    __slots__ = ("_id", "_side", "_quantity", "_price", "_timestamp")
+    __slots__ = ("_id_int", "side", "quantity", "price", "timestamp")
 
     def __init__(
         self,
@@ -66,35 +77,15 @@ class Order:
         price: float,
         timestamp=None,
     ) -> None:
-        object.__setattr__(self, "_id",        str(uuid.uuid4()))
-        object.__setattr__(self, "_side",      side)
-        object.__setattr__(self, "_quantity",  float(quantity))
-        object.__setattr__(self, "_price",     float(price))
-        object.__setattr__(self, "_timestamp", timestamp)
-
-    # ------------------------------------------------------------------
-    # Read-only properties
-    # ------------------------------------------------------------------
+        _set(self, "_id_int",   _next_order_id())
+        _set(self, "side",      side)
+        _set(self, "quantity",  float(quantity))
+        _set(self, "price",     float(price))
+        _set(self, "timestamp", timestamp)
 
     @property
     def id(self) -> str:
-        return self._id
-
-    @property
-    def side(self) -> str:
-        return self._side
-
-    @property
-    def quantity(self) -> float:
-        return self._quantity
-
-    @property
-    def price(self) -> float:
-        return self._price
-
-    @property
-    def timestamp(self):
-        return self._timestamp
+        return f"order-{self._id_int}"
 
     # ------------------------------------------------------------------
     # Immutability guard
@@ -105,11 +96,16 @@ class Order:
             f"Order is immutable — cannot set attribute '{name}'"
         )
 
+    def __delattr__(self, name):
+        raise AttributeError(
+            f"Order is immutable — cannot delete attribute '{name}'"
+        )
+
     def __repr__(self) -> str:
         return (
-            f"Order(id={self._id!r}, side={self._side!r}, "
-            f"quantity={self._quantity}, price={self._price}, "
-            f"timestamp={self._timestamp!r})"
+            f"Order(id={self.id!r}, side={self.side!r}, "
+            f"quantity={self.quantity}, price={self.price}, "
+            f"timestamp={self.timestamp!r})"
         )
 
 
@@ -123,8 +119,9 @@ class Fill:
 
     Parameters
     ----------
-    order_id : str
-        The ``id`` of the originating :class:`Order`.
+    order_id : str or None
+        The ``id`` of the originating :class:`Order`, or ``None`` for a
+        ``BrokerInterface.execute_market`` execution.
     side : str
         ``"BUY"`` or ``"SELL"``.
     quantity : float
@@ -140,15 +137,16 @@ class Fill:
     Notes
     -----
     Instances are immutable — attribute reassignment raises ``AttributeError``.
+    Fills with equal fields compare equal.
     """
 
     __slots__ = (
-        "_order_id",
-        "_side",
-        "_quantity",
-        "_price",
-        "_cash_change",
-        "_position_change",
+        "order_id",
+        "side",
+        "quantity",
+        "price",
+        "cash_change",
+        "position_change",
     )
 
     def __init__(
@@ -160,40 +158,24 @@ class Fill:
         cash_change: float,
         position_change: float,
     ) -> None:
-        object.__setattr__(self, "_order_id",        order_id)
-        object.__setattr__(self, "_side",            side)
-        object.__setattr__(self, "_quantity",        float(quantity))
-        object.__setattr__(self, "_price",           float(price))
-        object.__setattr__(self, "_cash_change",     float(cash_change))
-        object.__setattr__(self, "_position_change", float(position_change))
+        _set(self, "order_id",        order_id)
+        _set(self, "side",            side)
+        _set(self, "quantity",        float(quantity))
+        _set(self, "price",           float(price))
+        _set(self, "cash_change",     float(cash_change))
+        _set(self, "position_change", float(position_change))
 
-    # ------------------------------------------------------------------
-    # Read-only properties
-    # ------------------------------------------------------------------
+    def _fields(self) -> tuple:
+        return (self.order_id, self.side, self.quantity, self.price,
+                self.cash_change, self.position_change)
 
-    @property
-    def order_id(self) -> str:
-        return self._order_id
+    def __eq__(self, other):
+        if other.__class__ is not Fill:
+            return NotImplemented
+        return self._fields() == other._fields()
 
-    @property
-    def side(self) -> str:
-        return self._side
-
-    @property
-    def quantity(self) -> float:
-        return self._quantity
-
-    @property
-    def price(self) -> float:
-        return self._price
-
-    @property
-    def cash_change(self) -> float:
-        return self._cash_change
-
-    @property
-    def position_change(self) -> float:
-        return self._position_change
+    def __hash__(self) -> int:
+        return hash(self._fields())
 
     # ------------------------------------------------------------------
     # Immutability guard
@@ -204,10 +186,15 @@ class Fill:
             f"Fill is immutable — cannot set attribute '{name}'"
         )
 
+    def __delattr__(self, name):
+        raise AttributeError(
+            f"Fill is immutable — cannot delete attribute '{name}'"
+        )
+
     def __repr__(self) -> str:
         return (
-            f"Fill(order_id={self._order_id!r}, side={self._side!r}, "
-            f"quantity={self._quantity}, price={self._price}, "
-            f"cash_change={self._cash_change}, "
-            f"position_change={self._position_change})"
+            f"Fill(order_id={self.order_id!r}, side={self.side!r}, "
+            f"quantity={self.quantity}, price={self.price}, "
+            f"cash_change={self.cash_change}, "
+            f"position_change={self.position_change})"
         )
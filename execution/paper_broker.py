@@ -66,6 +66,12 @@ class PaperBroker(BrokerInterface):
         self._cash: float = float(initial_cash)
         self._position_size: float = 0.0
         self._slippage_pct: float = float(slippage_pct)
+        # Execution price multipliers, fixed for the broker's lifetime.
+        self._buy_factor: float = 1.0 + self._slippage_pct
+        self._sell_factor: float = 1.0 - self._slippage_pct
+        # side -> fill routine, so execution is one lookup rather than a
+        # chain of string comparisons.
+        self._side_handlers: dict = {BUY: self._buy, SELL: self._sell}
 
     # ------------------------------------------------------------------
     # Public read-only accessors
@@ -79,6 +85,22 @@ class PaperBroker(BrokerInterface):
     def position_size(self) -> float:
         return self._position_size
 
+    def reset(self, initial_cash: float) -> None:
+        """
+        Start over with *initial_cash* and no position.
+
+        Raises
+        ------
+        ValueError
+            If ``initial_cash`` <= 0.
+        """
+        if initial_cash <= 0:
+            raise ValueError(
+                f"initial_cash must be > 0, got {initial_cash!r}"
+            )
+        self._cash = float(initial_cash)
+        self._position_size = 0.0
+
     # ------------------------------------------------------------------
     # BrokerInterface implementation
     # ------------------------------------------------------------------
@@ -102,22 +124,34 @@ class PaperBroker(BrokerInterface):
             If a BUY order cannot be afforded, or a SELL order exceeds
             the current position.
         """
-        if order.side == BUY:
-            return self._execute_buy(order)
-        elif order.side == SELL:
-            return self._execute_sell(order)
-        else:
+        handler = self._side_handlers.get(order.side)
+        if handler is None:
             raise ValueError(
                 f"Unknown order side: {order.side!r}. Expected 'BUY' or 'SELL'."
             )
+        return handler(order.quantity, order.price, order.id)
+
+    def execute_market(self, side: str, quantity: float, price: float) -> Fill:
+        """
+        Execute without constructing an :class:`Order`.
+
+        Same execution model and validation as :meth:`execute_order`; the
+        returned :class:`Fill` has ``order_id=None``.
+        """
+        handler = self._side_handlers.get(side)
+        if handler is None:
+            raise ValueError(
+                f"Unknown order side: {side!r}. Expected 'BUY' or 'SELL'."
+            )
+        return handler(float(quantity), float(price), None)
 
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _execute_buy(self, order: Order) -> Fill:
-        execution_price = order.price * (1.0 + self._slippage_pct)
-        cost = execution_price * order.quantity
+    def _buy(self, quantity: float, price: float, order_id) -> Fill:
+        execution_price = price * self._buy_factor
+        cost = execution_price * quantity
 
         if cost > self._cash:
             raise ValueError(
@@ -125,35 +159,35 @@ class PaperBroker(BrokerInterface):
             )
 
         self._cash -= cost
-        self._position_size += order.quantity
+        self._position_size += quantity
 
         return Fill(
-            order_id=order.id,
+            order_id=order_id,
             side=BUY,
-            quantity=order.quantity,
+            quantity=quantity,
             price=execution_price,
             cash_change=-cost,
-            position_change=order.quantity,
+            position_change=quantity,
         )
 
-    def _execute_sell(self, order: Order) -> Fill:
-        if order.quantity > self._position_size:
+    def _sell(self, quantity: float, price: float, order_id) -> Fill:
+        if quantity > self._position_size:
             raise ValueError(
-                f"Insufficient position: need {order.quantity}, "
+                f"Insufficient position: need {quantity}, "
                 f"have {self._position_size}"
             )
 
-        execution_price = order.price * (1.0 - self._slippage_pct)
-        proceeds = execution_price * order.quantity
+        execution_price = price * self._sell_factor
+        proceeds = execution_price * quantity
 
-        self._position_size -= order.quantity
+        self._position_size -= quantity
         self._cash += proceeds
 
         return Fill(
-            order_id=order.id,
+            order_id=order_id,
             side=SELL,
-            quantity=order.quantity,
+            quantity=quantity,
             price=execution_price,
             cash_change=proceeds,
-            position_change=-order.quantity,
+            position_change=-quantity,
         )
@@ -25,7 +25,8 @@ Design
 * Each strategy gets its own :class:`PaperBroker` and
   :class:`ExecutionGateway` — no shared state between strategies.
 * Capital is split equally across strategies (``allocation="equal"``).
-* The aggregated equity curve is the element-wise sum of all individual
+* Each gateway processes the full candle stream in one batch; the
+  aggregated equity curve is the element-wise sum of the individual
   equity curves.
 * Deterministic: same candles always produce the same result.
 * Input candles are never mutated.
@@ -37,6 +38,8 @@ Validation
 * ``allocation`` must be ``"equal"`` → ``ValueError`` for any other value
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from execution.paper_broker import PaperBroker
 from execution.execution_gateway import ExecutionGateway
 
@@ -58,12 +61,26 @@ class PortfolioEngine:
     risk_manager : RiskManager or None, optional
         If provided, the same :class:`RiskManager` instance is passed to
         every :class:`ExecutionGateway`.  Default ``None``.
+    max_workers : int, optional
+        Number of threads used to run the strategies' gateways
+        concurrently.  Each gateway has its own broker and strategy; the
+        only shared object is *risk_manager*, which every gateway calls
+        concurrently.  :class:`RiskManager` only reads its configuration,
+        so it is safe to share; a custom risk manager must be thread-safe.
+        A new thread pool is started and shut down by every :meth:`run`
+        call, so the setup cost is paid per call; this only pays off for
+        long runs whose strategies release the GIL (C extensions, I/O,
+        free-threaded builds).  Default ``1`` (sequential, no pool).
+    record_trades : bool, optional
+        Passed to every :class:`ExecutionGateway`.  If ``False``, the
+        per-strategy ``trade_history`` in the result is empty.  Default
+        ``True``.
 
     Raises
     ------
     ValueError
-        If ``strategies`` is empty, ``initial_capital`` <= 0, or
-        ``allocation`` is not ``"equal"``.
+        If ``strategies`` is empty, ``initial_capital`` <= 0,
+        ``allocation`` is not ``"equal"``, or ``max_workers`` < 1.
     """
 
     def __init__(
@@ -72,6 +89,8 @@ class PortfolioEngine:
         initial_capital: float,
         allocation: str = "equal",
         risk_manager=None,
+        max_workers: int = 1,
+        record_trades: bool = True,
     ) -> None:
         if not strategies:
             raise ValueError("strategies must not be empty")
@@ -83,11 +102,16 @@ class PortfolioEngine:
             raise ValueError(
                 f"allocation must be 'equal', got {allocation!r}"
             )
+        if max_workers < 1:
+            raise ValueError(
+                f"max_workers must be >= 1, got {max_workers!r}"
+            )
 
-        self._strategies = list(strategies)
+        self._strategies = tuple(strategies)
         self._initial_capital = float(initial_capital)
         self._allocation = allocation
         self._risk_manager = risk_manager
+        self._max_workers = min(int(max_workers), len(self._strategies))
 
         # Build one broker + gateway per strategy
         capital_per = self._initial_capital / len(self._strategies)
@@ -100,6 +124,7 @@ class PortfolioEngine:
                 strategy_class,
                 broker,
                 risk_manager=risk_manager,
+                record_trades=record_trades,
             )
             self._brokers.append(broker)
             self._gateways.append(gateway)
@@ -110,7 +135,33 @@ class PortfolioEngine:
 
     # ------------------------------------------------------------------
 
-    def run(self, candles: list) -> dict:
+    def reset(self, initial_capital: float) -> None:
+        """
+        Restore the freshly constructed state with *initial_capital*.
+
+        Equivalent to building a new engine with the same strategies and
+        risk manager, but reuses the existing brokers and gateways.
+
+        Raises
+        ------
+        ValueError
+            If ``initial_capital`` <= 0.
+        """
+        if initial_capital <= 0:
+            raise ValueError(
+                f"initial_capital must be > 0, got {initial_capital!r}"
+            )
+        self._initial_capital = float(initial_capital)
+        capital_per = self._initial_capital / len(self._strategies)
+        for broker, gateway in zip(self._brokers, self._gateways):
+            broker.reset(capital_per)
+            gateway.reset()
+        self._portfolio_equity_curve = []
+        self._last_price = 0.0
+
+    # ------------------------------------------------------------------
+
+    def run(self, candles: list, closes: list = None) -> dict:
         """
         Feed every candle to all gateways and return the aggregated result.
 
@@ -119,6 +170,9 @@ class PortfolioEngine:
         candles : list[dict]
             Chronological OHLCV candles.  Each must contain ``"close"``.
             Not mutated.
+        closes : list[float], optional
+            ``float(candle["close"])`` for each candle, if the caller has
+            already extracted them.  Extracted here when omitted.
 
         Returns
         -------
@@ -129,29 +183,70 @@ class PortfolioEngine:
                 Per-strategy state:
                     cash, position_size, equity, trade_history
         """
-        # Reset aggregated curve for idempotent re-runs
-        self._portfolio_equity_curve = []
+        return self._run(candles, closes, vectorized=False)
+
+    def run_vectorized(self, candles: list, closes: list = None) -> dict:
+        """
+        Same as :meth:`run`, but each gateway generates all of its signals
+        up front and fills the equity between trades in bulk (see
+        :meth:`ExecutionGateway.run_vectorized`).  Results are identical;
+        prefer this for long candle streams with infrequent trades.
+        """
+        return self._run(candles, closes, vectorized=True)
+
+    def _run(self, candles: list, closes, vectorized: bool) -> dict:
+        # Strategies are independent, so each gateway consumes the whole
+        # stream in one batch; the portfolio curve is then the element-wise
+        # sum of the per-gateway curves for this run.
+        n = len(candles)
+        if closes is None:
+            closes = [float(candle["close"]) for candle in candles]
 
-        for candle in candles:
-            price = float(candle["close"])
-            self._last_price = price
+        gateways = self._gateways
+        starts = [gateway.equity_points for gateway in gateways]
+        for gateway in gateways:
+            gateway.reserve(n)
 
-            # Feed candle to every gateway
-            for gateway in self._gateways:
-                gateway.on_candle(candle)
+        if vectorized:
+            run_gateway = ExecutionGateway.run_vectorized
+        else:
+            run_gateway = ExecutionGateway.run_batch
+        if self._max_workers > 1:
+            # Scoped to this call so the engine never holds idle threads.
+            with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+                # list() surfaces the first exception raised by a gateway.
+                list(pool.map(
+                    lambda gateway: run_gateway(gateway, candles, closes),
+                    gateways,
+                ))
+        else:
+            for gateway in gateways:
+                run_gateway(gateway, candles, closes)
 
-            # Aggregate equity at this step
-            step_equity = sum(
-                broker.cash + broker.position_size * price
+        curves = [
+            gateway.equity_curve_since(start)
+            for gateway, start in zip(gateways, starts)
+        ]
+
+        if len(curves) == 1:
+            # Single strategy (e.g. the lifecycle manager's per-strategy
+            # engines): the portfolio curve is the gateway curve.
+            self._portfolio_equity_curve = curves[0].tolist()
+        else:
+            self._portfolio_equity_curve = list(map(sum, zip(*curves)))
+        if closes:
+            self._last_price = closes[-1]
+
+        # Build final state.  The last curve point is already the sum of
+        # every broker's equity at the last price; only an empty run needs
+        # to mark the brokers to market.
+        if self._portfolio_equity_curve:
+            portfolio_equity = self._portfolio_equity_curve[-1]
+        else:
+            portfolio_equity = sum(
+                broker.cash + broker.position_size * self._last_price
                 for broker in self._brokers
             )
-            self._portfolio_equity_curve.append(step_equity)
-
-        # Build final state
-        portfolio_equity = sum(
-            broker.cash + broker.position_size * self._last_price
-            for broker in self._brokers
-        )
 
         strategies_state = {}
         for strategy_class, broker, gateway in zip(
@@ -167,6 +262,7 @@ class PortfolioEngine:
 
         return {
             "portfolio_equity":       portfolio_equity,
-            "portfolio_equity_curve": list(self._portfolio_equity_curve),
+            # Rebuilt by every run, so handing out the list itself is safe.
+            "portfolio_equity_curve": self._portfolio_equity_curve,
             "strategies":             strategies_state,
         }
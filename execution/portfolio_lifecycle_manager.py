@@ -13,7 +13,9 @@ Integration flow
 
 At each rebalance step the manager:
 
-1. Runs ``ranking_engine.run(candles[:step+1])`` on the candles seen so far.
+1. Runs ``ranking_engine.run()`` on the candles seen so far
+   (``candles[:step+1]``, passed as a read-only view rather than a copy),
+   or feeds an incremental engine's ``update()`` only the new candles.
 2. Optionally filters out strategies where ``decay_detector.is_decayed()``
    is ``True``.  Filtered strategies are added to ``disabled_strategies``
    and remain disabled for the rest of the simulation.
@@ -21,7 +23,8 @@ At each rebalance step the manager:
    disabled.
 4. Computes new weights via ``allocator.compute_weights()``.
 5. Runs the next segment (candles from current step to next rebalance)
-   using a fresh ``PortfolioEngine`` seeded with the current equity.
+   with one ``PortfolioEngine`` per strategy seeded with the current
+   equity.  Engines are reset rather than rebuilt between segments.
 
 The equity curve is built segment-by-segment: each segment starts from
 the equity at the end of the previous segment.
@@ -31,12 +34,49 @@ Design constraints
 * No global state.
 * No mutation of input candles or strategies list.
 * Deterministic.
-* No async, no threading, no logging.
+* No async, no logging.  No threading unless ``max_workers`` > 1, in
+  which case only the per-strategy engine runs of a segment overlap;
+  results are still combined in strategy order.
 """
 
+import weakref
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
 from execution.portfolio_engine import PortfolioEngine
 
 
+class _PrefixView(Sequence):
+    """
+    Read-only view of ``candles[:end]`` that does not copy the list.
+
+    Handed to the ranking engine at each rebalance so that a growing
+    window costs O(1) to build instead of O(step).
+    """
+
+    __slots__ = ("_candles", "_end")
+
+    def __init__(self, candles: list, end: int) -> None:
+        self._candles = candles
+        self._end = min(end, len(candles))
+
+    def __len__(self) -> int:
+        return self._end
+
+    def __iter__(self):
+        return islice(self._candles, self._end)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._candles[i] for i in range(*index.indices(self._end))]
+        if index < 0:
+            index += self._end
+        if not 0 <= index < self._end:
+            raise IndexError("candle index out of range")
+        return self._candles[index]
+
+
 class PortfolioLifecycleManager:
     """
     Periodic rebalancing lifecycle manager.
@@ -48,7 +88,14 @@ class PortfolioLifecycleManager:
     initial_capital : float
         Total capital.  Must be > 0.
     ranking_engine : object
-        Must expose ``run(candles) -> list[dict]``.
+        Must expose ``run(candles) -> list[dict]``.  An engine that keeps
+        rolling statistics may instead expose ``update(new_candles) ->
+        list[dict]`` and ``reset()``: it is reset at the start of each
+        :meth:`run` and then fed only the candles added since its previous
+        rebalance, each exactly once.  An engine whose results do not
+        depend on the candles may set ``stateless = True``; it is then
+        run once per :meth:`run` and its results reused at every
+        rebalance.
     allocator : object
         Must expose ``compute_weights(ranking_results) -> dict``.
     rebalance_policy : RebalancePolicy
@@ -56,11 +103,19 @@ class PortfolioLifecycleManager:
     decay_detector : PerformanceDecayDetector or None, optional
         If provided, strategies that fail the decay check are disabled.
         Default ``None``.
+    max_workers : int, optional
+        Threads used to run a segment's per-strategy engines
+        concurrently.  The pool is created on first use and kept across
+        runs; call :meth:`close` (or use the manager as a context
+        manager) to release its threads.  A manager that is never closed
+        shuts its pool down when garbage-collected.  Default ``1``
+        (sequential, no pool).
 
     Raises
     ------
     ValueError
-        If ``strategies`` is empty or ``initial_capital`` <= 0.
+        If ``strategies`` is empty, ``initial_capital`` <= 0, or
+        ``max_workers`` < 1.
     """
 
     def __init__(
@@ -71,6 +126,7 @@ class PortfolioLifecycleManager:
         allocator,
         rebalance_policy,
         decay_detector=None,
+        max_workers: int = 1,
     ) -> None:
         if not strategies:
             raise ValueError("strategies must not be empty")
@@ -78,13 +134,42 @@ class PortfolioLifecycleManager:
             raise ValueError(
                 f"initial_capital must be > 0, got {initial_capital!r}"
             )
+        if max_workers < 1:
+            raise ValueError(
+                f"max_workers must be >= 1, got {max_workers!r}"
+            )
 
-        self._strategies = list(strategies)          # defensive copy
+        self._strategies = tuple(strategies)         # immutable snapshot
+        self._names = tuple(cls.__name__ for cls in self._strategies)
         self._initial_capital = float(initial_capital)
         self._ranking_engine = ranking_engine
         self._allocator = allocator
         self._rebalance_policy = rebalance_policy
         self._decay_detector = decay_detector
+        self._max_workers = int(max_workers)
+        self._pool = None
+        self._pool_finalizer = None
+
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """
+        Shut down the worker pool, if one was started, and wait for its
+        threads to exit.  Required for ``max_workers`` > 1 unless the
+        manager is used in a ``with`` block.  A later :meth:`run` starts
+        a new pool.
+        """
+        if self._pool is not None:
+            self._pool_finalizer.detach()
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_finalizer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     # ------------------------------------------------------------------
 
@@ -114,21 +199,62 @@ class PortfolioLifecycleManager:
             }
 
         n = len(candles)
-        active_strategies = list(self._strategies)
+        # Extracted once; each segment's engines share a slice of this.
+        closes = [float(candle["close"]) for candle in candles]
+        # Bound once; the rebalance loop below uses these on every segment.
+        strategies = self._strategies
+        names = self._names
+        ranking_engine = self._ranking_engine
+        allocator = self._allocator
+        policy = self._rebalance_policy
+        detector = self._decay_detector
+        run_segment = self._run_segment
+        active_strategies = strategies
+        active_names = names
+        active_name_set = set(names)
+        # Once every strategy is disabled, decay checks have nothing to do.
+        strategy_names = frozenset(names)
+        disabled_count = 0
         disabled_names: list = []
+        disabled_set: set = set()
         rebalance_steps: list = []
-        equity_curve: list = []
+        # Segments tile [0, n) exactly, so every slot gets overwritten.
+        equity_curve: list = [0.0] * n
+        # Single-strategy engines reused (reset) from segment to segment
+        engine_pool: dict = {}
 
         # Current capital and weights
         current_capital = self._initial_capital
-        current_weights = {
-            cls.__name__: 1.0 / len(active_strategies)
-            for cls in active_strategies
-        }
+        # Fallback weights for the current active set; rebuilt only when a
+        # strategy is disabled.
+        equal_weights = dict.fromkeys(names, 1.0 / len(names))
+        current_weights = equal_weights
+
+        # A stateless engine is ranked once; incremental engines see each
+        # candle once per run.
+        stateless = getattr(ranking_engine, "stateless", False)
+        static_results = None
+        update_ranking = None
+        if stateless:
+            try:
+                static_results = ranking_engine.run(candles)
+            except Exception:
+                static_results = None
+        else:
+            update_ranking = getattr(ranking_engine, "update", None)
+            if update_ranking is not None:
+                ranking_engine.reset()
+        ranked_end = 0
 
         # Find all rebalance points
-        rebalance_points = [i for i in range(n)
-                            if self._rebalance_policy.should_rebalance(i)]
+        # Policies that know their schedule (e.g. RebalancePolicy) skip the
+        # per-step should_rebalance() scan.
+        schedule = getattr(policy, "schedule", None)
+        if schedule is not None:
+            rebalance_points = list(schedule(n))
+        else:
+            rebalance_points = [i for i in range(n)
+                                if policy.should_rebalance(i)]
 
         # Build segment boundaries: [start, end) pairs
         # Each segment runs from one rebalance point to the next
@@ -154,54 +280,76 @@ class PortfolioLifecycleManager:
             rebalance_steps.append(seg_start)
 
             # Rank on candles seen so far (up to and including seg_start)
-            window = candles[: seg_start + 1]
             try:
-                ranking_results = self._ranking_engine.run(window)
+                if stateless:
+                    ranking_results = static_results
+                elif update_ranking is not None:
+                    new_candles = candles[ranked_end: seg_start + 1]
+                    ranked_end = seg_start + 1
+                    ranking_results = update_ranking(new_candles)
+                else:
+                    window = _PrefixView(candles, seg_start + 1)
+                    ranking_results = ranking_engine.run(window)
             except Exception:
                 ranking_results = None
 
             if ranking_results is not None:
                 # Decay detection
-                if self._decay_detector is not None:
+                newly_disabled = False
+                if (detector is not None
+                        and disabled_count < len(strategy_names)):
                     for result in ranking_results:
                         name = result["strategy_name"]
-                        if name not in disabled_names:
-                            if self._decay_detector.is_decayed(result):
+                        if name not in disabled_set:
+                            if detector.is_decayed(result):
+                                disabled_set.add(name)
                                 disabled_names.append(name)
-
-                # Determine active strategies
-                new_active = [
-                    cls for cls in self._strategies
-                    if cls.__name__ not in disabled_names
-                ]
-                if not new_active:
-                    new_active = list(self._strategies)
-                active_strategies = new_active
+                                newly_disabled = True
+                                if name in strategy_names:
+                                    disabled_count += 1
+                                    if disabled_count == len(strategy_names):
+                                        break
+
+                # Determine active strategies (only changes when a
+                # strategy has just been disabled)
+                if newly_disabled:
+                    keep = [i for i, name in enumerate(names)
+                            if name not in disabled_set]
+                    if keep:
+                        active_strategies = tuple(
+                            strategies[i] for i in keep
+                        )
+                        active_names = tuple(names[i] for i in keep)
+                    else:
+                        active_strategies = strategies
+                        active_names = names
+                    active_name_set = set(active_names)
+                    equal_weights = dict.fromkeys(
+                        active_names, 1.0 / len(active_names)
+                    )
 
                 # Compute weights
-                active_names = {cls.__name__ for cls in active_strategies}
                 active_results = [
                     r for r in ranking_results
-                    if r["strategy_name"] in active_names
+                    if r["strategy_name"] in active_name_set
                 ]
                 if active_results:
-                    current_weights = self._allocator.compute_weights(active_results)
+                    current_weights = allocator.compute_weights(active_results)
                 else:
-                    n_act = len(active_strategies)
-                    current_weights = {
-                        cls.__name__: 1.0 / n_act
-                        for cls in active_strategies
-                    }
+                    current_weights = equal_weights
 
             # --- Run this segment with current capital ---
-            seg_equity_curve = self._run_segment(
+            seg_equity_curve = run_segment(
                 strategies=active_strategies,
+                names=active_names,
                 weights=current_weights,
                 capital=current_capital,
                 candles=seg_candles,
+                closes=closes[seg_start:seg_end],
+                engine_pool=engine_pool,
             )
 
-            equity_curve.extend(seg_equity_curve)
+            equity_curve[seg_start:seg_end] = seg_equity_curve
 
             # Update capital for next segment
             if seg_equity_curve:
@@ -220,10 +368,13 @@ class PortfolioLifecycleManager:
 
     def _run_segment(
         self,
-        strategies: list,
+        strategies: tuple,
+        names: tuple,
         weights: dict,
         capital: float,
         candles: list,
+        closes: list,
+        engine_pool: dict,
     ) -> list:
         """
         Run a single segment of candles and return the equity curve.
@@ -234,39 +385,62 @@ class PortfolioLifecycleManager:
         if not candles or capital <= 0:
             return [capital] * len(candles)
 
-        # Build per-strategy engines with weighted capital
-        engines = []
-        for cls in strategies:
-            name = cls.__name__
-            w = weights.get(name, 0.0)
-            strat_capital = capital * w
-            if strat_capital > 0:
-                engine = PortfolioEngine(
-                    strategies=[cls],
-                    initial_capital=strat_capital,
-                    allocation="equal",
-                )
-                engines.append(engine)
-
-        if not engines:
-            # Fallback: equal allocation
+        # Per-strategy capital; equal split if no strategy has weight
+        allocations = [
+            (cls, capital * weights.get(name, 0.0))
+            for cls, name in zip(strategies, names)
+        ]
+        allocations = [(cls, c) for cls, c in allocations if c > 0]
+        if not allocations:
             n = len(strategies)
-            for cls in strategies:
-                engine = PortfolioEngine(
-                    strategies=[cls],
-                    initial_capital=capital / n,
-                    allocation="equal",
-                )
-                engines.append(engine)
-
-        # Run all engines on the segment candles
-        results = [engine.run(candles) for engine in engines]
+            allocations = [(cls, capital / n) for cls in strategies]
 
-        # Aggregate equity curve step by step
-        seg_len = len(candles)
-        seg_equity = []
-        for i in range(seg_len):
-            step_equity = sum(r["portfolio_equity_curve"][i] for r in results)
-            seg_equity.append(step_equity)
+        # Pool key is (class, occurrence) so a class listed twice still
+        # gets two independent engines.
+        engines = []
+        occurrences: dict = {}
+        for cls, strat_capital in allocations:
+            key = (cls, occurrences.get(cls, 0))
+            occurrences[cls] = key[1] + 1
+            engines.append(self._engine_for(key, strat_capital, engine_pool))
 
-        return seg_equity
+        # Run all engines on the segment candles
+        if self._max_workers > 1 and len(engines) > 1:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self._max_workers)
+                # Release the threads even if close() is never called.
+                self._pool_finalizer = weakref.finalize(
+                    self, self._pool.shutdown, wait=False
+                )
+            results = list(self._pool.map(
+                lambda engine: engine.run(candles, closes), engines
+            ))
+        else:
+            results = [engine.run(candles, closes) for engine in engines]
+
+        # Aggregate equity curves element-wise
+        if len(results) == 1:
+            return results[0]["portfolio_equity_curve"]
+        return list(map(
+            sum, zip(*[r["portfolio_equity_curve"] for r in results])
+        ))
+
+    @staticmethod
+    def _engine_for(key: tuple, capital: float, engine_pool: dict) -> PortfolioEngine:
+        """
+        Return a fresh single-strategy engine for ``key = (cls, k)`` seeded
+        with *capital*, resetting the one in *engine_pool* if there is one.
+        """
+        engine = engine_pool.get(key)
+        if engine is None:
+            engine = PortfolioEngine(
+                strategies=[key[0]],
+                initial_capital=capital,
+                allocation="equal",
+                # Only the equity curve is used here.
+                record_trades=False,
+            )
+            engine_pool[key] = engine
+        else:
+            engine.reset(capital)
+        return engine
@@ -46,6 +46,11 @@ class RebalancePolicy:
                 f"interval must be > 0, got {interval!r}"
             )
         self._interval = int(interval)
+        # For power-of-two intervals the modulo test is a bitmask test.
+        if self._interval & (self._interval - 1) == 0:
+            self._mask = self._interval - 1
+        else:
+            self._mask = None
 
     # ------------------------------------------------------------------
 
@@ -69,4 +74,16 @@ class RebalancePolicy:
         bool
             ``True`` when ``step % interval == 0``.
         """
+        mask = self._mask
+        if mask is not None:
+            return step & mask == 0
         return step % self._interval == 0
+
+    def schedule(self, n: int) -> range:
+        """
+        Return every step in ``range(n)`` at which a rebalance occurs.
+
+        Equivalent to filtering ``range(n)`` with :meth:`should_rebalance`,
+        without calling it once per step.
+        """
+        return range(0, n, self._interval)
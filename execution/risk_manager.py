@@ -60,6 +60,26 @@ class RiskManager:
 
     # ------------------------------------------------------------------
 
+    def adjust_buy_qty(self, quantity: float, price: float, equity: float) -> float:
+        """
+        Return the BUY *quantity* capped to the position-size limit.
+
+        The numeric core of :meth:`adjust_order`, for callers that have
+        not built an :class:`Order`.
+
+        Raises
+        ------
+        ValueError
+            If ``equity`` < 0.
+        """
+        if equity < 0:
+            raise ValueError(
+                f"equity must be >= 0, got {equity!r}"
+            )
+        max_value = equity * self._max_position_pct
+        max_quantity = max_value / price if price > 0 else 0.0
+        return min(quantity, max_quantity)
+
     def adjust_order(self, order: Order, equity: float) -> Order:
         """
         Return *order* (possibly with a reduced quantity) that respects
@@ -93,9 +113,7 @@ class RiskManager:
         if order.side != BUY:
             return order
 
-        max_value = equity * self._max_position_pct
-        max_quantity = max_value / order.price if order.price > 0 else 0.0
-        adjusted_qty = min(order.quantity, max_quantity)
+        adjusted_qty = self.adjust_buy_qty(order.quantity, order.price, equity)
 
         if adjusted_qty >= order.quantity:
             # No adjustment needed
@@ -45,6 +45,8 @@ class StrategyRegistry:
     def __init__(self) -> None:
         # Ordered dict: name -> strategy_class
         self._registry: dict = {}
+        # Snapshot of the registered names; rebuilt after register/unregister.
+        self._names_cache: tuple = None
 
     # ------------------------------------------------------------------
     def register(self, name: str, strategy_class: type) -> None:
@@ -69,6 +71,7 @@ class StrategyRegistry:
                 "Unregister it first or choose a different name."
             )
         self._registry[name] = strategy_class
+        self._names_cache = None
 
     # ------------------------------------------------------------------
     def unregister(self, name: str) -> None:
@@ -88,6 +91,7 @@ class StrategyRegistry:
         if name not in self._registry:
             raise KeyError(f"Strategy '{name}' is not registered.")
         del self._registry[name]
+        self._names_cache = None
 
     # ------------------------------------------------------------------
     def get(self, name: str) -> type:
@@ -122,4 +126,6 @@ class StrategyRegistry:
         -------
         list[str]
         """
-        return list(self._registry.keys())
+        if self._names_cache is None:
+            self._names_cache = tuple(self._registry)
+        return list(self._names_cache)
@@ -9,7 +9,8 @@ Flow
 1. Fetch historical candles via a :class:`MarketDataProvider`.
 2. Run the :class:`EvolutionEngine` to find the best strategy genome.
 3. Convert the best genome to a strategy class.
-4. Rank strategies using :class:`StrategyRankingEngine`.
+4. Rank strategies with the Backtester, or with
+   :class:`StrategyRankingEngine` when deep ranking is requested.
 5. Allocate capital using :class:`CapitalAllocator`.
 6. Run the :class:`PortfolioLifecycleManager`.
 7. Compute full analytics via :class:`PortfolioAnalytics`.
@@ -28,7 +29,16 @@ The pipeline is deterministic when a seed is provided.
 """
 
 import copy
+import functools
+import hashlib
+import heapq
+import operator
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
+from app.backtester.engine import Backtester
 from data.data_provider import MarketDataProvider
 from ai.evolution_engine import EvolutionEngine
 from ai.strategy_genome import genome_to_strategy_class
@@ -53,6 +63,8 @@ def run_full_pipeline(
     decay_threshold: float = -1.0,
     allocator_mode: str = "sharpe",
     seed: int = 42,
+    max_workers: int = 1,
+    deep_rank: bool = False,
 ) -> dict:
     """
     Run the full automated research pipeline.
@@ -81,6 +93,18 @@ def run_full_pipeline(
         Capital allocation mode.  Default ``"sharpe"``.
     seed : int or None, optional
         Random seed.  Default 42.
+    max_workers : int, optional
+        Number of worker processes for the Backtester ranking of the top
+        strategies.  Only worth raising for long candle histories, since
+        each worker receives its own copy of the candles.  Default ``1``
+        (in-process).
+    deep_rank : bool, optional
+        Always re-rank the top strategies with
+        :class:`StrategyRankingEngine` (walk-forward, Monte Carlo and
+        stability scores) instead of using the Backtester ranking.  Meant
+        for final selection; sweeps should leave it off.  Without it the
+        deep ranking only runs when every Backtester composite score is
+        trivial (|score| <= 0.001).  Default ``False``.
 
     Returns
     -------
@@ -92,115 +116,112 @@ def run_full_pipeline(
         ranking_results     : list[dict]
         portfolio_result    : dict
         analytics_report    : dict
+        error               : str, only if the run stopped early (no
+                              candles, or fewer than 30); the other
+                              results are then empty
     """
     # 1. Fetch data
     candles = provider.get_historical(symbol, start, end, interval="1d")
     if not candles:
-        return {
-            "symbol":           symbol,
-            "candle_count":     0,
-            "best_genome":      None,
-            "best_fitness":     None,
-            "ranking_results":  [],
-            "portfolio_result": {},
-            "analytics_report": {},
-            "error":            "No candles returned by provider",
-        }
-
-    # 2. Evolve strategies
-    evolution = EvolutionEngine(
-        candles=candles,
+        return _empty_result(symbol, 0, "No candles returned by provider")
+    # Too short to evolve or rank meaningfully; skip the expensive stages.
+    if len(candles) < _MIN_CANDLES:
+        return _empty_result(
+            symbol,
+            len(candles),
+            f"Insufficient candles: got {len(candles)}, "
+            f"need at least {_MIN_CANDLES}",
+        )
+
+    # 2. Evolve strategies (memoised across calls for a fixed seed)
+    evo_result = _evolve(
+        candles,
         population_size=population_size,
         generations=generations,
         seed=seed,
-        fitness_mode="fast",
         initial_cash=initial_capital / max(population_size, 1),
     )
-    evo_result = evolution.run()
     best_genome   = evo_result["best_genome"]
     best_fitness  = evo_result["best_fitness"]
 
     # 3. Build strategy classes from top genomes (deduplicated by type)
     history = evo_result["history"]
-    # Sort by fitness descending, take top unique genomes
-    seen_types = set()
-    top_strategies = []
-    for entry in sorted(history, key=lambda x: x["fitness"], reverse=True):
-        g = entry["genome"]
-        key = (g["type"], str(sorted(g.items())))
-        if key not in seen_types:
-            seen_types.add(key)
-            top_strategies.append(genome_to_strategy_class(g))
-        if len(top_strategies) >= 3:
-            break
-
-    if not top_strategies:
-        top_strategies = [genome_to_strategy_class(best_genome)]
+    # Fittest first; only a handful of entries are needed unless the top
+    # of the history is mostly duplicates.
+    by_fitness = operator.itemgetter("fitness")
+    top_genomes = _unique_genomes(
+        heapq.nlargest(_TOP_CANDIDATES, history, key=by_fitness), 3
+    )
+    if len(top_genomes) < 3 and len(history) > _TOP_CANDIDATES:
+        top_genomes = _unique_genomes(
+            sorted(history, key=by_fitness, reverse=True), 3
+        )
+    if not top_genomes:
+        top_genomes = [best_genome]
+    top_strategies = [genome_to_strategy_class(g) for g in top_genomes]
 
     # 4. Rank strategies — always use backtester for real metrics first,
-    #    then try StrategyRankingEngine for full composite score.
-    from app.backtester.engine import Backtester as _BT
-
-    def _bt_rank(strategies, candles, initial_cash):
+    #    then optionally try StrategyRankingEngine for full composite score.
+    def _bt_rank(genomes, candles, initial_cash):
         """Build ranking results directly from Backtester."""
-        results = []
-        for i, cls in enumerate(strategies):
-            bt = _BT(initial_cash / len(strategies))
+        cash = initial_cash / len(genomes)
+        ranks = range(1, len(genomes) + 1)
+        results = None
+        if max_workers > 1 and len(genomes) > 1:
+            # Genomes, unlike the classes built from them, are picklable.
             try:
-                r = bt.run([copy.copy(c) for c in candles], strategy=cls())
-                sharpe = r.get("sharpe_ratio", 0.0) or 0.0
-                calmar = r.get("calmar_ratio", 0.0) or 0.0
-                mdd    = r.get("max_drawdown_pct", 0.0) or 0.0
-                ret    = r.get("return_pct", 0.0) or 0.0
-                score  = sharpe - abs(mdd) * 0.5
+                with ProcessPoolExecutor(
+                    max_workers=min(max_workers, len(genomes))
+                ) as pool:
+                    results = list(pool.map(
+                        _bt_rank_entry, genomes, repeat(candles),
+                        repeat(cash), ranks,
+                    ))
             except Exception:
-                sharpe = calmar = mdd = ret = score = 0.0
-            results.append({
-                "strategy_name":   cls.__name__,
-                "backtest":        {"return_pct": ret, "sharpe_ratio": sharpe,
-                                    "calmar_ratio": calmar, "max_drawdown_pct": mdd},
-                "stability":       {"stability_score": 0.0},
-                "walk_forward":    {"mean_test_sharpe": 0.0, "performance_decay": 0.0},
-                "monte_carlo":     {"mean_sharpe": 0.0, "sharpe_variance": 0.0,
-                                    "probability_of_loss": 0.5},
-                "robustness":      0.0,
-                "composite_score": score,
-                "rank":            i + 1,
-            })
+                results = None  # Pool unavailable; rank in-process
+        if results is None:
+            results = list(map(
+                _bt_rank_entry, genomes, repeat(candles), repeat(cash), ranks
+            ))
         results.sort(key=lambda r: r["composite_score"], reverse=True)
         for i, r in enumerate(results):
             r["rank"] = i + 1
         return results
 
     # Always start with backtester-based ranking (guaranteed to work)
-    ranking_results = _bt_rank(top_strategies, candles, initial_capital)
+    ranking_results = _bt_rank(top_genomes, candles, initial_capital)
 
-    # Try to upgrade to full StrategyRankingEngine composite score
-    n = len(candles)
-    train_size = max(10, min(n // 5, 50))
-    test_size  = max(5,  min(n // 10, 25))
-    step_size  = max(5,  min(n // 10, 25))
-    while train_size + test_size > n and train_size > 10:
-        train_size = max(10, train_size - 5)
-        test_size  = max(5,  test_size  - 2)
+    # Upgrade to the full StrategyRankingEngine composite score when asked
+    # to, or when the backtester scores cannot separate the strategies.
+    if deep_rank or all(
+        abs(r["composite_score"]) <= 0.001 for r in ranking_results
+    ):
+        n = len(candles)
+        train_size = max(10, min(n // 5, 50))
+        test_size  = max(5,  min(n // 10, 25))
+        step_size  = max(5,  min(n // 10, 25))
+        while train_size + test_size > n and train_size > 10:
+            train_size = max(10, train_size - 5)
+            test_size  = max(5,  test_size  - 2)
 
-    try:
-        ranking_engine = StrategyRankingEngine(
-            strategies=top_strategies,
-            candles=[copy.copy(c) for c in candles],
-            initial_cash=initial_capital / len(top_strategies),
-            train_size=train_size,
-            test_size=test_size,
-            step_size=step_size,
-            simulations=10,
-            seed=seed,
-        )
-        full_results = ranking_engine.run()
-        # Only use full results if they have non-trivial composite scores
-        if any(abs(r["composite_score"]) > 0.001 for r in full_results):
-            ranking_results = full_results
-    except Exception:
-        pass  # Keep backtester-based ranking
+        try:
+            ranking_engine = StrategyRankingEngine(
+                strategies=top_strategies,
+                # Documented not to mutate its candles; no per-candle copy.
+                candles=candles,
+                initial_cash=initial_capital / len(top_strategies),
+                train_size=train_size,
+                test_size=test_size,
+                step_size=step_size,
+                simulations=10,
+                seed=seed,
+            )
+            full_results = ranking_engine.run()
+            # Only use full results if they have non-trivial composite scores
+            if any(abs(r["composite_score"]) > 0.001 for r in full_results):
+                ranking_results = full_results
+        except Exception:
+            pass  # Keep backtester-based ranking
 
     # 5. Allocate capital
     allocator = CapitalAllocator(mode=allocator_mode)
@@ -228,10 +249,10 @@ def run_full_pipeline(
     analytics_report = {}
     if len(equity_curve) >= 2:
         # Guard: PortfolioAnalytics requires all values > 0
-        safe_curve = [max(v, 0.01) for v in equity_curve]
+        safe_curve = tuple([max(v, 0.01) for v in equity_curve])
         try:
-            pa = PortfolioAnalytics(safe_curve)
-            analytics_report = pa.full_report()
+            # Deep copy: the cached report (and its lists) is shared.
+            analytics_report = copy.deepcopy(_analytics_report(safe_curve))
         except Exception:
             analytics_report = {}
 
@@ -246,6 +267,169 @@ def run_full_pipeline(
     }
 
 
+# ---------------------------------------------------------------------------
+# Internal helper: early-exit result
+# ---------------------------------------------------------------------------
+
+# Fewest candles the pipeline will run on.
+_MIN_CANDLES = 30
+
+
+def _empty_result(symbol: str, candle_count: int, error: str) -> dict:
+    """Pipeline result for a run that stopped before evolution."""
+    return {
+        "symbol":           symbol,
+        "candle_count":     candle_count,
+        "best_genome":      None,
+        "best_fitness":     None,
+        "ranking_results":  [],
+        "portfolio_result": {},
+        "analytics_report": {},
+        "error":            error,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Internal helper: memoised evolution
+# ---------------------------------------------------------------------------
+
+# Seeded evolution is deterministic in its inputs, so repeated pipeline runs
+# over the same candles (API requests, parameter sweeps over the later
+# stages) can reuse the result.  Bounded LRU, shared by all threads.
+_EVOLUTION_CACHE_SIZE = 32
+_evolution_cache: OrderedDict = OrderedDict()
+_evolution_cache_lock = threading.Lock()
+
+
+def _candles_digest(candles: list) -> str:
+    """Content hash of *candles* (every key and value of every candle)."""
+    return hashlib.blake2b(repr(candles).encode()).hexdigest()
+
+
+def _evolve(
+    candles: list,
+    population_size: int,
+    generations: int,
+    seed,
+    initial_cash: float,
+) -> dict:
+    """
+    Run :class:`EvolutionEngine` in ``"fast"`` fitness mode, reusing the
+    result of an earlier call with identical inputs.
+
+    The cache key holds exactly the inputs the evolution depends on; an
+    unseeded run is never cached.  Callers get a deep copy, so mutating
+    the result cannot affect later calls.
+    """
+    def run() -> dict:
+        return EvolutionEngine(
+            candles=candles,
+            population_size=population_size,
+            generations=generations,
+            seed=seed,
+            fitness_mode="fast",
+            initial_cash=initial_cash,
+        ).run()
+
+    if seed is None:
+        return run()
+
+    key = (population_size, generations, seed, initial_cash,
+           _candles_digest(candles))
+    with _evolution_cache_lock:
+        result = _evolution_cache.get(key)
+        if result is not None:
+            _evolution_cache.move_to_end(key)
+    if result is None:
+        result = run()
+        with _evolution_cache_lock:
+            _evolution_cache[key] = result
+            _evolution_cache.move_to_end(key)
+            if len(_evolution_cache) > _EVOLUTION_CACHE_SIZE:
+                _evolution_cache.popitem(last=False)
+    return copy.deepcopy(result)
+
+
+# ---------------------------------------------------------------------------
+# Internal helper: memoised analytics
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=256)
+def _analytics_report(curve: tuple) -> dict:
+    """
+    ``PortfolioAnalytics(curve).full_report()``, reused for a repeated
+    curve (e.g. sweeps whose lifecycle output does not change).
+    """
+    return PortfolioAnalytics(list(curve)).full_report()
+
+
+# ---------------------------------------------------------------------------
+# Internal helper: top genome selection
+# ---------------------------------------------------------------------------
+
+# History entries examined before falling back to a full sort.
+_TOP_CANDIDATES = 10
+
+
+def _unique_genomes(entries: list, limit: int) -> list:
+    """Return the first *limit* distinct genomes of *entries*, in order."""
+    seen = set()
+    genomes = []
+    for entry in entries:
+        g = entry["genome"]
+        # Genome values are scalars, so the sorted items hash directly.
+        key = (g["type"], tuple(sorted(g.items())))
+        if key not in seen:
+            seen.add(key)
+            genomes.append(g)
+            if len(genomes) >= limit:
+                break
+    return genomes
+
+
+# ---------------------------------------------------------------------------
+# Internal helper: Backtester-based ranking entry
+# ---------------------------------------------------------------------------
+
+def _make_ranking_entry(name: str, bt: dict = None, rank: int = 1) -> dict:
+    """
+    Build a ranking entry shaped like :class:`StrategyRankingEngine`'s from
+    a Backtester result *bt*; missing metrics (or ``bt=None`` for a failed
+    backtest) count as zero.
+    """
+    bt = bt or {}
+    sharpe = bt.get("sharpe_ratio", 0.0) or 0.0
+    calmar = bt.get("calmar_ratio", 0.0) or 0.0
+    mdd    = bt.get("max_drawdown_pct", 0.0) or 0.0
+    ret    = bt.get("return_pct", 0.0) or 0.0
+    return {
+        "strategy_name":   name,
+        "backtest":        {"return_pct": ret, "sharpe_ratio": sharpe,
+                            "calmar_ratio": calmar, "max_drawdown_pct": mdd},
+        "stability":       {"stability_score": 0.0},
+        "walk_forward":    {"mean_test_sharpe": 0.0, "performance_decay": 0.0},
+        "monte_carlo":     {"mean_sharpe": 0.0, "sharpe_variance": 0.0,
+                            "probability_of_loss": 0.5},
+        "robustness":      0.0,
+        "composite_score": sharpe - abs(mdd) * 0.5,
+        "rank":            rank,
+    }
+
+
+def _bt_rank_entry(genome: dict, candles: list, cash: float, rank: int) -> dict:
+    """
+    Backtest the strategy built from *genome* with *cash* and return its
+    ranking entry.  Module-level so that it can run in a worker process.
+    """
+    cls = genome_to_strategy_class(genome)
+    try:
+        # Backtester and the genome strategies only read candles.
+        r = Backtester(cash).run(candles, strategy=cls())
+        return _make_ranking_entry(cls.__name__, r, rank)
+    except Exception:
+        return _make_ranking_entry(cls.__name__, None, rank)
+
+
 # ---------------------------------------------------------------------------
 # Internal helper: static ranking engine wrapper
 # ---------------------------------------------------------------------------
@@ -253,22 +437,26 @@ def run_full_pipeline(
 class _StaticRankingEngine:
     """Returns pre-computed ranking results regardless of candles passed."""
 
+    # Results never depend on the candles, so the lifecycle manager may
+    # rank once per run instead of at every rebalance.
+    stateless = True
+
     def __init__(self, results: list, strategies: list) -> None:
-        self._results = results
         self._strategies = strategies
+        if not results:
+            # Fallback: minimal results, built once
+            results = [
+                {
+                    "strategy_name": cls.__name__,
+                    "backtest": {"sharpe_ratio": 0.0, "calmar_ratio": 0.0,
+                                 "return_pct": 0.0, "max_drawdown_pct": 0.0},
+                    "robustness": 0.0,
+                    "composite_score": 0.0,
+                    "rank": i + 1,
+                }
+                for i, cls in enumerate(strategies)
+            ]
+        self._results = results
 
     def run(self, candles: list) -> list:
-        if self._results:
-            return self._results
-        # Fallback: return minimal results
-        return [
-            {
-                "strategy_name": cls.__name__,
-                "backtest": {"sharpe_ratio": 0.0, "calmar_ratio": 0.0,
-                             "return_pct": 0.0, "max_drawdown_pct": 0.0},
-                "robustness": 0.0,
-                "composite_score": 0.0,
-                "rank": i + 1,
-            }
-            for i, cls in enumerate(self._strategies)
-        ]
+        return self._results
@@ -34,33 +34,32 @@ def _metrics_from_sample(sample: list[float], initial_cash: float) -> dict:
     -------
     dict with keys: final_equity, return_pct, sharpe_ratio, max_drawdown_pct
     """
-    # Compound equity curve
-    eq = initial_cash
-    curve = [eq]
+    # Compound equity and track the running peak-to-trough drawdown (as %
+    # of peak) in one pass; the curve itself is never materialised.  Only
+    # a point below the running peak can deepen the drawdown.
+    eq   = initial_cash
+    peak = eq
+    mdd  = 0.0
     for r in sample:
         eq = eq * (1 + r)
-        curve.append(eq)
-
-    final_equity = curve[-1]
+        if eq > peak:
+            peak = eq
+        elif eq < peak:
+            dd = (eq - peak) / peak * 100
+            if dd < mdd:
+                mdd = dd
+
+    final_equity = eq
     return_pct   = (final_equity - initial_cash) / initial_cash * 100
 
-    # Sharpe ratio — ret_series = [0.0] + sample, Bessel-corrected std
-    ret_series = [0.0] + list(sample)
-    m          = len(ret_series)
-    mean_r     = sum(ret_series) / m
-    var_r      = sum((x - mean_r) ** 2 for x in ret_series) / (m - 1)
-    std_r      = math.sqrt(var_r)
-    sharpe     = mean_r / std_r if std_r != 0.0 else 0.0
-
-    # Max drawdown — running peak-to-trough as % of peak
-    peak = curve[0]
-    mdd  = 0.0
-    for v in curve:
-        if v > peak:
-            peak = v
-        dd = (v - peak) / peak * 100
-        if dd < mdd:
-            mdd = dd
+    # Sharpe ratio — ret_series = [0.0] + sample, Bessel-corrected std.
+    # The leading 0.0 adds nothing to the sum and mean_r ** 2 to the
+    # squared deviations, so it is folded in rather than prepended.
+    m      = len(sample) + 1
+    mean_r = sum(sample) / m
+    var_r  = sum([(x - mean_r) ** 2 for x in sample], mean_r ** 2) / (m - 1)
+    std_r  = math.sqrt(var_r)
+    sharpe = mean_r / std_r if std_r != 0.0 else 0.0
 
     return {
         "final_equity":     final_equity,
@@ -201,8 +200,9 @@ class MonteCarloEngine:
 
         if mode == "returns":
             n = len(returns_series)
+            choices = rng.choices
             for _ in range(simulations):
-                sample = rng.choices(returns_series, k=n)
+                sample = choices(returns_series, k=n)
                 sim_results.append(_metrics_from_sample(sample, self._initial_cash))
 
         elif mode == "trades":
@@ -213,21 +213,30 @@ class MonteCarloEngine:
 
         else:  # execution
             n = len(returns_series)
+            choices = rng.choices
+            gauss = rng.gauss
             for _ in range(simulations):
                 # Step 1 — bootstrap sample (same RNG calls as returns mode)
-                sample = rng.choices(returns_series, k=n)
+                sample = choices(returns_series, k=n)
 
                 # Step 2 — apply noise only when std > 0
                 # Skipping gauss calls when std == 0 keeps the RNG state
                 # identical to returns mode, ensuring zero-std execution
-                # reproduces the returns-mode baseline exactly.
-                modified = []
-                for r in sample:
-                    if shock_std != 0.0:
-                        r = r * rng.gauss(1.0, shock_std)
-                    if slippage_std != 0.0:
-                        r = r - rng.gauss(0.0, slippage_std)
-                    modified.append(r)
+                # reproduces the returns-mode baseline exactly.  The std
+                # checks are made once per path rather than per return;
+                # with both active the shock is still drawn before the
+                # slippage for each return.
+                if shock_std != 0.0 and slippage_std != 0.0:
+                    modified = [
+                        r * gauss(1.0, shock_std) - gauss(0.0, slippage_std)
+                        for r in sample
+                    ]
+                elif shock_std != 0.0:
+                    modified = [r * gauss(1.0, shock_std) for r in sample]
+                elif slippage_std != 0.0:
+                    modified = [r - gauss(0.0, slippage_std) for r in sample]
+                else:
+                    modified = sample
 
                 sim_results.append(_metrics_from_sample(modified, self._initial_cash))
 
@@ -6,8 +6,6 @@ Splits a list of candle dicts into sequential, non-overlapping time windows
 for regime-based strategy analysis.
 """
 
-import copy
-
 
 def split_into_time_windows(
     candles: list[dict], window_size: int
@@ -25,10 +23,11 @@ def split_into_time_windows(
     Returns
     -------
     list[list[dict]]
-        Windows in chronological order.  Each window is a deep-copied slice
-        of *candles* so that neither the original list nor any candle dict
-        is mutated.  The final (remainder) window is included only when it
-        contains at least 2 candles; a trailing window of length 1 is
+        Windows in chronological order.  Each window is a slice of
+        *candles* holding copies of its candle dicts, so that neither the
+        original list nor any candle dict is mutated.  The final
+        (remainder) window is included only when it contains at least 2
+        candles; a trailing window of length 1 is
         silently discarded.
 
     Raises
@@ -56,8 +55,8 @@ def split_into_time_windows(
 
         # Only include this slice if it has at least 2 candles
         if len(slice_) >= 2:
-            # Deep-copy each candle so callers cannot mutate the originals
-            windows.append([copy.copy(c) for c in slice_])
+            # Copy each candle so callers cannot mutate the originals
+            windows.append([dict(c) for c in slice_])
 
         start = end
 
@@ -24,10 +24,11 @@ The three Monte Carlo statistics come directly from
 returns series of every fold.
 """
 
-import copy
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 from app.backtester.engine import Backtester
-from research.walk_forward_engine import walk_forward_analysis  # noqa: F401  (validates fold params)
+from research.walk_forward_engine import validate_fold_params
 from research.monte_carlo_engine import MonteCarloEngine
 
 
@@ -55,6 +56,11 @@ class RobustnessEngine:
         results when fixed.  Default ``None``.
     initial_cash : float, optional
         Starting cash for each ``Backtester`` instance.  Default 1000.
+    max_workers : int, optional
+        Number of worker processes across which folds are run.  Folds are
+        independent, so results do not depend on this, but
+        *strategy_class* must be picklable (defined at module level);
+        otherwise folds run in-process.  Default ``1`` (in-process).
     """
 
     def __init__(
@@ -67,6 +73,7 @@ class RobustnessEngine:
         simulations: int = 100,
         seed=None,
         initial_cash: float = 1000,
+        max_workers: int = 1,
     ) -> None:
         self._strategy_class = strategy_class
         self._candles        = candles
@@ -76,6 +83,7 @@ class RobustnessEngine:
         self._simulations    = simulations
         self._seed           = seed
         self._initial_cash   = initial_cash
+        self._max_workers    = max_workers
 
     # ------------------------------------------------------------------
     def run(self) -> dict:
@@ -99,28 +107,22 @@ class RobustnessEngine:
             When ``simulations < 1`` (propagated from MonteCarloEngine).
         """
         # ---------------------------------------------------------------- #
-        # Step 1 — validate fold parameters by delegating to               #
-        # walk_forward_analysis.  We call it but discard the result;       #
-        # its only purpose here is centralised parameter validation so     #
-        # we don't duplicate the guard logic.                              #
+        # Step 1 — validate fold parameters with the same guards as        #
+        # walk_forward_analysis, without running its backtests.            #
         # ---------------------------------------------------------------- #
-        walk_forward_analysis(
-            self._strategy_class,
-            self._candles,
-            train_size=self._train_size,
-            test_size=self._test_size,
-            step_size=self._step_size,
-            initial_cash=self._initial_cash,
+        validate_fold_params(
+            len(self._candles),
+            self._train_size,
+            self._test_size,
+            self._step_size,
         )
 
         # ---------------------------------------------------------------- #
         # Step 2 — slide folds and compute per-fold robustness scores      #
         # ---------------------------------------------------------------- #
-        fold_scores:     list[float] = []
-        fold_mc_results: list[dict]  = []
-
-        pos = 0
         candles = self._candles
+        test_slices = []
+        pos = 0
 
         while True:
             test_slice = candles[
@@ -131,43 +133,42 @@ class RobustnessEngine:
             if len(test_slice) < self._test_size:
                 break
 
-            # ------------------------------------------------------------ #
-            # Run backtester on test slice to obtain per-period returns     #
-            # ------------------------------------------------------------ #
-            bt = Backtester(self._initial_cash)
-            test_result = bt.run(
-                [copy.copy(c) for c in test_slice],
-                strategy=self._strategy_class(),
-            )
-            test_returns_series = test_result["returns_series"]
-
-            # ------------------------------------------------------------ #
-            # Monte Carlo analysis over the test returns                    #
-            # ------------------------------------------------------------ #
-            mc_engine = MonteCarloEngine(
-                initial_cash=self._initial_cash,
-                seed=self._seed,
-            )
-            mc_result = mc_engine.analyze(
-                returns_series=test_returns_series,
-                mode="returns",
-                simulations=self._simulations,
-            )
-
-            # ------------------------------------------------------------ #
-            # R_i = mc_mean_sharpe - mc_sharpe_variance - mc_prob_of_loss  #
-            # ------------------------------------------------------------ #
-            r_i = (
-                mc_result["mean_sharpe"]
-                - mc_result["sharpe_variance"]
-                - mc_result["probability_of_loss"]
-            )
-
-            fold_scores.append(r_i)
-            fold_mc_results.append(mc_result)
-
+            test_slices.append(test_slice)
             pos += self._step_size
 
+        # One engine serves every fold: analyze() reseeds its RNG per call,
+        # so each fold sees the same draws as with a fresh engine.
+        mc_engine = MonteCarloEngine(
+            initial_cash=self._initial_cash,
+            seed=self._seed,
+        )
+        fold_args = (
+            repeat(self._strategy_class), test_slices,
+            repeat(self._initial_cash), repeat(mc_engine),
+            repeat(self._simulations),
+        )
+        fold_mc_results = None
+        if self._max_workers > 1 and len(test_slices) > 1:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=min(self._max_workers, len(test_slices))
+                ) as pool:
+                    fold_mc_results = list(pool.map(_run_fold, *fold_args))
+            except Exception:
+                # Unpicklable strategy or no pool; any genuine error
+                # resurfaces from the in-process run below.
+                fold_mc_results = None
+        if fold_mc_results is None:
+            fold_mc_results = list(map(_run_fold, *fold_args))
+
+        # R_i = mc_mean_sharpe - mc_sharpe_variance - mc_prob_of_loss
+        fold_scores: list[float] = [
+            mc_result["mean_sharpe"]
+            - mc_result["sharpe_variance"]
+            - mc_result["probability_of_loss"]
+            for mc_result in fold_mc_results
+        ]
+
         # ---------------------------------------------------------------- #
         # Step 3 — global robustness score                                 #
         # ---------------------------------------------------------------- #
@@ -178,3 +179,39 @@ class RobustnessEngine:
             "fold_mc_results":  fold_mc_results,
             "robustness_score": robustness_score,
         }
+
+
+# ---------------------------------------------------------------------------
+# Per-fold worker
+# ---------------------------------------------------------------------------
+
+def _run_fold(
+    strategy_class,
+    test_slice: list[dict],
+    initial_cash: float,
+    mc_engine: MonteCarloEngine,
+    simulations: int,
+) -> dict:
+    """
+    Backtest one fold's test slice and return the ``MonteCarloEngine``
+    analysis of its returns.  Module-level so that folds can run in worker
+    processes.
+    """
+    # ------------------------------------------------------------ #
+    # Run backtester on test slice to obtain per-period returns     #
+    # ------------------------------------------------------------ #
+    bt = Backtester(initial_cash)
+    test_result = bt.run(
+        [dict(c) for c in test_slice],
+        strategy=strategy_class(),
+    )
+    test_returns_series = test_result["returns_series"]
+
+    # ------------------------------------------------------------ #
+    # Monte Carlo analysis over the test returns                    #
+    # ------------------------------------------------------------ #
+    return mc_engine.analyze(
+        returns_series=test_returns_series,
+        mode="returns",
+        simulations=simulations,
+    )
@@ -26,8 +26,6 @@ Composite score formula
       - 1.0 * abs(performance_decay)
 """
 
-import copy
-
 from app.backtester.engine import Backtester
 from research.stability_engine import analyze_strategy as stability_analyze
 from research.walk_forward_engine import walk_forward_analysis
@@ -116,6 +114,11 @@ class StrategyRankingEngine:
             Propagated from ``MonteCarloEngine`` when ``simulations < 1``.
         """
         results = []
+        # Shared by every strategy: analyze() reseeds its RNG per call.
+        mc_engine = MonteCarloEngine(
+            initial_cash=self._initial_cash,
+            seed=self._seed,
+        )
 
         for strategy_class in self._strategies:
             # ---------------------------------------------------------- #
@@ -123,7 +126,7 @@ class StrategyRankingEngine:
             # ---------------------------------------------------------- #
             bt = Backtester(self._initial_cash)
             bt_result = bt.run(
-                [copy.copy(c) for c in self._candles],
+                [dict(c) for c in self._candles],
                 strategy=strategy_class(),
             )
 
@@ -141,7 +144,7 @@ class StrategyRankingEngine:
             # that the same candle budget is respected across all engines.
             stab_result = stability_analyze(
                 strategy_class,
-                [copy.copy(c) for c in self._candles],
+                [dict(c) for c in self._candles],
                 window_size=self._train_size,
                 initial_cash=self._initial_cash,
             )
@@ -155,7 +158,7 @@ class StrategyRankingEngine:
             # ---------------------------------------------------------- #
             wf_result = walk_forward_analysis(
                 strategy_class,
-                [copy.copy(c) for c in self._candles],
+                [dict(c) for c in self._candles],
                 train_size=self._train_size,
                 test_size=self._test_size,
                 step_size=self._step_size,
@@ -170,10 +173,6 @@ class StrategyRankingEngine:
             # ---------------------------------------------------------- #
             # 4. Monte Carlo analysis on the full backtest returns series  #
             # ---------------------------------------------------------- #
-            mc_engine = MonteCarloEngine(
-                initial_cash=self._initial_cash,
-                seed=self._seed,
-            )
             mc_result = mc_engine.analyze(
                 returns_series=bt_result["returns_series"],
                 mode="returns",
@@ -191,7 +190,7 @@ class StrategyRankingEngine:
             # ---------------------------------------------------------- #
             rob_engine = RobustnessEngine(
                 strategy_class=strategy_class,
-                candles=[copy.copy(c) for c in self._candles],
+                candles=[dict(c) for c in self._candles],
                 train_size=self._train_size,
                 test_size=self._test_size,
                 step_size=self._step_size,
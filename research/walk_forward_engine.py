@@ -7,11 +7,39 @@ and evaluates it on the immediately following out-of-sample test window,
 sliding both windows forward by ``step_size`` candles each iteration.
 """
 
-import copy
-
 from app.backtester.engine import Backtester
 
 
+def validate_fold_params(
+    candle_count: int,
+    train_size: int,
+    test_size: int,
+    step_size: int,
+) -> None:
+    """
+    Validate walk-forward fold geometry without running any backtest.
+
+    Raises
+    ------
+    ValueError
+        Exactly as :func:`walk_forward_analysis` does for the same
+        parameters and ``len(candles) == candle_count``.
+    """
+    if train_size < 2:
+        raise ValueError(f"train_size must be >= 2, got {train_size}")
+    if test_size < 2:
+        raise ValueError(f"test_size must be >= 2, got {test_size}")
+    if step_size < 1:
+        raise ValueError(f"step_size must be >= 1, got {step_size}")
+
+    # At least one complete window must fit in the dataset
+    if candle_count < train_size + test_size:
+        raise ValueError(
+            f"Dataset too small: need at least {train_size + test_size} candles "
+            f"for one window, got {candle_count}"
+        )
+
+
 def walk_forward_analysis(
     strategy_class,
     candles: list[dict],
@@ -65,21 +93,7 @@ def walk_forward_analysis(
     # ------------------------------------------------------------------ #
     # Parameter validation                                                 #
     # ------------------------------------------------------------------ #
-    if train_size < 2:
-        raise ValueError(f"train_size must be >= 2, got {train_size}")
-    if test_size < 2:
-        raise ValueError(f"test_size must be >= 2, got {test_size}")
-    if step_size < 1:
-        raise ValueError(f"step_size must be >= 1, got {step_size}")
-
-    # ------------------------------------------------------------------ #
-    # Check that at least one complete window fits in the dataset          #
-    # ------------------------------------------------------------------ #
-    if len(candles) < train_size + test_size:
-        raise ValueError(
-            f"Dataset too small: need at least {train_size + test_size} candles "
-            f"for one window, got {len(candles)}"
-        )
+    validate_fold_params(len(candles), train_size, test_size, step_size)
 
     # ------------------------------------------------------------------ #
     # Sliding-window loop                                                  #
@@ -98,14 +112,14 @@ def walk_forward_analysis(
         # Run strategy on train slice
         bt_train = Backtester(initial_cash)
         r_train  = bt_train.run(
-            [copy.copy(c) for c in train_slice],
+            [dict(c) for c in train_slice],
             strategy=strategy_class(),
         )
 
         # Run strategy on test slice
         bt_test = Backtester(initial_cash)
         r_test  = bt_test.run(
-            [copy.copy(c) for c in test_slice],
+            [dict(c) for c in test_slice],
             strategy=strategy_class(),
         )
 
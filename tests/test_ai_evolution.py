@@ -91,6 +91,16 @@ def test_genome_to_strategy_class_breakout():
     assert isinstance(cls, type)
 
 
+def test_genome_to_strategy_class_equal_genomes_share_class():
+    genome = {"type": "moving_average", "short": 5, "long": 20}
+    cls = genome_to_strategy_class(genome)
+    assert genome_to_strategy_class(dict(genome)) is cls
+    a, b = cls(), cls()
+    for _ in range(25):
+        a.generate_signal({"close": 100.0})
+    assert b._prices == []
+
+
 def test_strategy_class_instantiable():
     cls = genome_to_strategy_class({"type": "moving_average", "short": 5, "long": 20})
     instance = cls()
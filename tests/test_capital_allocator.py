@@ -394,3 +394,39 @@ def test_compute_weights_keys_match_strategy_names():
     ]
     weights = CapitalAllocator().compute_weights(results)
     assert set(weights.keys()) == {"Alpha", "Beta"}
+
+
+# ===========================================================================
+# Part 13 — Weight cache
+# ===========================================================================
+
+def test_cached_weights_are_independent_copies():
+    allocator = CapitalAllocator(mode="sharpe")
+    results = [make_result("A", 1.0, 0.5), make_result("B", 3.0, 0.5)]
+    w1 = allocator.compute_weights(results)
+    w1["A"] = 99.0
+    w2 = allocator.compute_weights(results)
+    assert w2["A"] == pytest.approx(0.25)
+
+
+def test_cache_reflects_changed_metrics():
+    allocator = CapitalAllocator(mode="robustness")
+    w1 = allocator.compute_weights([make_result("A", 0.0, 1.0), make_result("B", 0.0, 1.0)])
+    w2 = allocator.compute_weights([make_result("A", 0.0, 3.0), make_result("B", 0.0, 1.0)])
+    assert w1["A"] == pytest.approx(0.5)
+    assert w2["A"] == pytest.approx(0.75)
+
+
+def test_cache_is_bounded():
+    allocator = CapitalAllocator(mode="sharpe")
+    for i in range(100):
+        allocator.compute_weights([make_result("A", float(i + 1), 0.0)])
+    assert len(allocator._cache) <= 32
+
+
+def test_equal_fallback_reused_across_changing_metrics():
+    allocator = CapitalAllocator(mode="sharpe")
+    w1 = allocator.compute_weights([make_result("A", -1.0, 0.0), make_result("B", -2.0, 0.0)])
+    w2 = allocator.compute_weights([make_result("A", -3.0, 0.0), make_result("B", -0.5, 0.0)])
+    assert w1 == w2 == {"A": 0.5, "B": 0.5}
+    assert len(allocator._equal_cache) == 1
@@ -4,6 +4,7 @@ Tests for data layer (data_provider, cache, yahoo_provider, alpha_vantage_provid
 These tests cover:
 - Abstract interface raises NotImplementedError
 - JSONFileCache: make_key, has/get/set/clear
+- MemoryTieredCache: memory tier, LRU eviction, invalidation
 - YahooProvider: parse logic (no real HTTP calls)
 - AlphaVantageProvider: validation, parse logic (no real HTTP calls)
 """
@@ -14,8 +15,8 @@ import tempfile
 import pytest
 
 from data.data_provider import MarketDataProvider
-from data.cache import JSONFileCache
-from data.yahoo_provider import YahooProvider
+from data.cache import JSONFileCache, MemoryTieredCache
+from data.yahoo_provider import YahooProvider, _from_unix, _to_unix
 from data.alpha_vantage_provider import AlphaVantageProvider
 
 
@@ -29,6 +30,24 @@ def test_abstract_provider_raises():
         provider.get_historical("AAPL", "2020-01-01", "2020-12-31")
 
 
+class _EchoProvider(MarketDataProvider):
+    def get_historical(self, symbol, start, end, interval="1d"):
+        return [{"timestamp": start, "symbol": symbol, "interval": interval}]
+
+
+def test_get_historical_batch_maps_symbols_in_order():
+    result = _EchoProvider().get_historical_batch(
+        ["RELIANCE", "TCS", "INFY"], "2020-01-01", "2020-12-31", "1h"
+    )
+    assert list(result) == ["RELIANCE", "TCS", "INFY"]
+    assert result["TCS"][0]["symbol"] == "TCS"
+    assert result["INFY"][0]["interval"] == "1h"
+
+
+def test_get_historical_batch_empty():
+    assert _EchoProvider().get_historical_batch([], "2020-01-01", "2020-12-31") == {}
+
+
 # ===========================================================================
 # Part 2 — JSONFileCache
 # ===========================================================================
@@ -93,6 +112,52 @@ def test_cache_clear_nonexistent_no_error():
         cache.clear("nonexistent")  # should not raise
 
 
+def test_tiered_cache_serves_from_memory_after_file_removed():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = MemoryTieredCache(cache_dir=tmpdir)
+        data = [{"timestamp": "2020-01-01", "close": 100.0}]
+        cache.set("k", data)
+        os.remove(os.path.join(tmpdir, "k.json"))
+        assert cache.has("k") is True
+        assert cache.get("k") == data
+
+
+def test_tiered_cache_promotes_disk_hit():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        JSONFileCache(cache_dir=tmpdir).set("k", [{"close": 1.0}])
+        cache = MemoryTieredCache(cache_dir=tmpdir)
+        first = cache.get("k")
+        assert cache.get("k") is first
+
+
+def test_tiered_cache_evicts_least_recently_used():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = MemoryTieredCache(cache_dir=tmpdir, max_entries=2)
+        cache.set("a", [1])
+        cache.set("b", [2])
+        cache.get("a")
+        cache.set("c", [3])
+        assert list(cache._memory) == ["a", "c"]
+        assert cache.get("b") == [2]  # still on disk
+
+
+def test_tiered_cache_clear_invalidates_memory():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = MemoryTieredCache(cache_dir=tmpdir)
+        cache.set("k1", [1])
+        cache.set("k2", [2])
+        cache.clear("k1")
+        assert cache.has("k1") is False
+        cache.clear_all()
+        assert cache.has("k2") is False
+
+
+def test_tiered_cache_invalid_max_entries_raises():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with pytest.raises(ValueError):
+            MemoryTieredCache(cache_dir=tmpdir, max_entries=0)
+
+
 # ===========================================================================
 # Part 3 — YahooProvider._parse (unit test without HTTP)
 # ===========================================================================
@@ -177,6 +242,13 @@ def test_yahoo_parse_skips_none_values():
     assert len(candles) == 1  # second candle skipped
 
 
+def test_yahoo_unix_conversions_round_trip():
+    assert _to_unix("2020-01-01") == 1577836800
+    assert _from_unix(1577836800) == "2020-01-01"
+    assert _from_unix(1577836800 + 86399) == "2020-01-01"
+    assert _from_unix(_to_unix("2024-02-29")) == "2024-02-29"
+
+
 # ===========================================================================
 # Part 4 — AlphaVantageProvider validation
 # ===========================================================================
@@ -246,3 +318,72 @@ def test_alpha_vantage_parse_no_time_series_key():
     raw = json.dumps({"Note": "API rate limit reached"})
     candles = AlphaVantageProvider._parse(raw, "1d", "2020-01-01", "2020-12-31")
     assert candles == []
+
+
+def _av_bar(close):
+    return {"1. open": close, "2. high": close, "3. low": close,
+            "4. close": close, "6. volume": "1000"}
+
+
+def test_alpha_vantage_parse_newest_first_is_chronological():
+    raw = json.dumps({
+        "Time Series (Daily)": {
+            "2020-01-06": _av_bar("103.0"),
+            "2020-01-03": _av_bar("102.0"),
+            "2020-01-02": _av_bar("101.0"),
+        }
+    })
+    candles = AlphaVantageProvider._parse(raw, "1d", "2020-01-01", "2020-12-31")
+    assert [c["timestamp"] for c in candles] == [
+        "2020-01-02", "2020-01-03", "2020-01-06",
+    ]
+
+
+def test_alpha_vantage_parse_unordered_falls_back_to_sort():
+    raw = json.dumps({
+        "Time Series (Daily)": {
+            "2020-01-03": _av_bar("102.0"),
+            "2020-01-06": _av_bar("103.0"),
+            "2020-01-02": _av_bar("101.0"),
+        }
+    })
+    candles = AlphaVantageProvider._parse(raw, "1d", "2020-01-01", "2020-12-31")
+    assert [c["close"] for c in candles] == [101.0, 102.0, 103.0]
+
+
+def test_alpha_vantage_parse_newest_first_stops_before_start():
+    raw = json.dumps({
+        "Time Series (Daily)": {
+            "2020-01-06": _av_bar("103.0"),
+            "2020-01-03": _av_bar("102.0"),
+            "2019-12-31": _av_bar("99.0"),
+            "2019-12-30": _av_bar("98.0"),
+        }
+    })
+    candles = AlphaVantageProvider._parse(raw, "1d", "2020-01-01", "2020-01-03")
+    assert [c["timestamp"] for c in candles] == ["2020-01-03"]
+
+
+def test_alpha_vantage_parse_intraday_volume_field():
+    raw = json.dumps({
+        "Time Series (5min)": {
+            "2020-01-02 16:00:00": {"1. open": "300.0", "2. high": "310.0",
+                                    "3. low": "295.0", "4. close": "305.0",
+                                    "5. volume": "1200"},
+        }
+    })
+    candles = AlphaVantageProvider._parse(raw, "5min", "2020-01-01", "2020-12-31")
+    assert len(candles) == 1
+    assert candles[0]["volume"] == pytest.approx(1200.0)
+
+
+def test_alpha_vantage_parse_skips_bar_with_missing_field():
+    raw = json.dumps({
+        "Time Series (Daily)": {
+            "2020-01-03": {"1. open": "305.0", "2. high": "315.0",
+                           "3. low": "300.0", "6. volume": "1100000"},
+            "2020-01-02": _av_bar("101.0"),
+        }
+    })
+    candles = AlphaVantageProvider._parse(raw, "1d", "2020-01-01", "2020-12-31")
+    assert [c["timestamp"] for c in candles] == ["2020-01-02"]
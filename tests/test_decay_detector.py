@@ -176,3 +176,19 @@ def test_is_decayed_does_not_mutate_input():
     original = copy.deepcopy(result)
     d.is_decayed(result)
     assert result == original
+
+
+# ===========================================================================
+# Part 8 — Batch evaluation
+# ===========================================================================
+
+def test_filter_decayed_matches_is_decayed():
+    results = [make_result(s, r) for s, r in ((0.5, 2.0), (1.5, 0.1), (1.0, 1.0))]
+    for metric in ("sharpe", "robustness"):
+        d = PerformanceDecayDetector(threshold=1.0, metric=metric)
+        assert d.filter_decayed(results) == [d.is_decayed(r) for r in results]
+
+
+def test_filter_decayed_empty():
+    d = PerformanceDecayDetector(threshold=1.0)
+    assert d.filter_decayed([]) == []
@@ -455,7 +455,7 @@ def test_on_candle_does_not_mutate_input():
 
 
 # ===========================================================================
-# Part 12 — get_state returns copies (not internal references)
+# Part 12 — get_state does not expose mutable internal state
 # ===========================================================================
 
 def test_get_state_equity_curve_is_copy():
@@ -468,13 +468,28 @@ def test_get_state_equity_curve_is_copy():
     assert len(state2["equity_curve"]) == 1
 
 
-def test_get_state_trade_history_is_copy():
+def test_get_state_trade_history_is_read_only():
     gateway = make_gateway(AlwaysBuyFirst, initial_cash=1000)
     gateway.on_candle(make_candle(100.0))
     state = gateway.get_state()
-    state["trade_history"].append({"type": "FAKE"})
+    with pytest.raises(AttributeError):
+        state["trade_history"].append({"type": "FAKE"})
+    with pytest.raises(TypeError):
+        state["trade_history"][0]["type"] = "FAKE"
     state2 = gateway.get_state()
     assert len(state2["trade_history"]) == 1
+    assert state2["trade_history"][0]["type"] == "BUY"
+
+
+def test_get_state_trade_history_reused_until_next_trade():
+    gateway = make_gateway(AlwaysBuySell, initial_cash=1000)
+    gateway.on_candle(make_candle(100.0))
+    first = gateway.get_state()["trade_history"]
+    assert gateway.get_state()["trade_history"] is first
+    gateway.on_candle(make_candle(110.0))
+    second = gateway.get_state()["trade_history"]
+    assert len(second) == 2
+    assert second[0] is first[0]
 
 
 # ===========================================================================
@@ -539,3 +554,111 @@ def test_default_initial_cash_is_1000():
     gateway = ExecutionGateway(AlwaysFlat, broker)
     state = gateway.get_state()
     assert state["cash"] == pytest.approx(1000.0)
+
+
+# ===========================================================================
+# Part 16 — run_batch matches on_candle
+# ===========================================================================
+
+def test_run_batch_matches_on_candle():
+    candles = [make_candle(p) for p in (100.0, 110.0, 90.0, 120.0, 130.0)]
+    rm = RiskManager(max_position_pct=0.5)
+    batched = make_gateway(AlwaysBuySell, risk_manager=rm)
+    batched.run_batch(candles)
+    manual = make_gateway(AlwaysBuySell, risk_manager=rm)
+    for c in candles:
+        manual.on_candle(c)
+    assert batched.get_state() == manual.get_state()
+
+
+def test_run_batch_missing_close_raises_after_prior_candles():
+    gateway = make_gateway(AlwaysBuyFirst)
+    with pytest.raises(KeyError):
+        gateway.run_batch([make_candle(100.0), {"open": 1.0}])
+    state = gateway.get_state()
+    assert state["state"] == "LONG"
+    assert state["equity_curve"] == pytest.approx([1000.0])
+
+
+def test_reserve_does_not_expose_unfilled_slots():
+    gateway = make_gateway(AlwaysFlat)
+    gateway.reserve(10)
+    gateway.on_candle(make_candle(100.0))
+    gateway.run_batch([make_candle(100.0), make_candle(100.0)])
+    assert gateway.get_state()["equity_curve"] == pytest.approx([1000.0] * 3)
+
+
+def test_run_batch_beyond_reserved_capacity():
+    gateway = make_gateway(AlwaysBuyFirst)
+    gateway.reserve(1)
+    gateway.run_batch([make_candle(100.0), make_candle(110.0), make_candle(120.0)])
+    assert gateway.get_state()["equity_curve"] == pytest.approx([1000.0, 1100.0, 1200.0])
+
+
+def test_compact_equity_curve_is_single_precision():
+    broker = PaperBroker(initial_cash=1000)
+    gateway = ExecutionGateway(AlwaysBuyFirst, broker, compact_equity_curve=True)
+    gateway.reserve(2)
+    gateway.run_batch([make_candle(100.1), make_candle(100.2)])
+    state = gateway.get_state()
+    assert state["equity_curve"] == pytest.approx([1000.0, 1000.0 * 100.2 / 100.1], rel=1e-6)
+    assert state["equity"] == pytest.approx(1000.0 / 100.1 * 100.2, rel=1e-12)
+    assert gateway._equity_curve.itemsize == 4
+
+
+# ===========================================================================
+# Part 17 — run_vectorized matches run_batch
+# ===========================================================================
+
+@pytest.mark.parametrize("strategy_class", [AlwaysFlat, AlwaysBuyFirst, AlwaysBuySell])
+def test_run_vectorized_matches_run_batch(strategy_class):
+    candles = [make_candle(p) for p in (100.0, 110.0, 90.0, 120.0, 130.0)]
+    vectorized = make_gateway(strategy_class)
+    vectorized.run_vectorized(candles)
+    batched = make_gateway(strategy_class)
+    batched.run_batch(candles)
+    assert vectorized.get_state() == batched.get_state()
+
+
+def test_run_vectorized_continues_previous_batch():
+    candles = [make_candle(p) for p in (100.0, 110.0, 90.0, 120.0)]
+    gateway = make_gateway(AlwaysBuySell)
+    gateway.run_batch(candles[:1])
+    gateway.run_vectorized(candles[1:])
+    reference = make_gateway(AlwaysBuySell)
+    reference.run_batch(candles)
+    assert gateway.get_state() == reference.get_state()
+
+
+def test_run_vectorized_accepts_iterator():
+    candles = [make_candle(p) for p in (100.0, 110.0, 90.0, 120.0, 130.0)]
+    vectorized = make_gateway(AlwaysBuySell)
+    vectorized.run_vectorized(iter(candles))
+    batched = make_gateway(AlwaysBuySell)
+    batched.run_batch(iter(candles))
+    assert len(vectorized.get_state()["equity_curve"]) == 5
+    assert vectorized.get_state() == batched.get_state()
+
+
+def test_run_vectorized_missing_close_processes_nothing():
+    gateway = make_gateway(AlwaysBuyFirst)
+    with pytest.raises(KeyError):
+        gateway.run_vectorized([make_candle(100.0), {"open": 1.0}])
+    assert gateway.get_state()["equity_curve"] == []
+
+
+# ===========================================================================
+# Part 18 — record_trades=False
+# ===========================================================================
+
+def test_unrecorded_trades_are_counted_not_logged():
+    candles = [make_candle(p) for p in (100.0, 110.0, 90.0, 120.0)]
+    broker = PaperBroker(initial_cash=1000)
+    gateway = ExecutionGateway(AlwaysBuySell, broker, record_trades=False)
+    gateway.run_batch(candles)
+    reference = make_gateway(AlwaysBuySell)
+    reference.run_batch(candles)
+    state = gateway.get_state()
+    assert state["trade_history"] == ()
+    assert gateway.trade_count == reference.trade_count == 4
+    assert state["equity_curve"] == reference.get_state()["equity_curve"]
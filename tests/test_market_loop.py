@@ -263,3 +263,21 @@ def test_run_returns_state_after_last_candle():
     result = MarketLoop(gateway).run(candles)
     # Bought 10 shares at 100, final price 300 → equity = 3000
     assert result["equity"] == pytest.approx(3000.0)
+
+
+# ===========================================================================
+# Part 9 — run_fast() matches run()
+# ===========================================================================
+
+def test_run_fast_matches_run():
+    candles = [make_candle(p) for p in (100.0, 120.0, 90.0, 110.0, 130.0)]
+    fast = MarketLoop(make_gateway(AlwaysBuySell)).run_fast(candles)
+    slow = MarketLoop(make_gateway(AlwaysBuySell)).run(candles)
+    assert fast == slow
+
+
+def test_run_fast_missing_close_processes_nothing():
+    gateway = make_gateway(AlwaysBuyFirst)
+    with pytest.raises(KeyError):
+        MarketLoop(gateway).run_fast([make_candle(100.0), {"open": 1.0}])
+    assert gateway.get_state()["equity_curve"] == []
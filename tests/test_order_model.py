@@ -4,7 +4,7 @@ Tests for execution.order — Order and Fill models.
 Contract
 --------
 Order(side, quantity, price, timestamp=None)
-    id          : str  (uuid4, unique per instance)
+    id          : str  ("order-<n>", unique per instance)
     side        : str
     quantity    : float
     price       : float
@@ -259,3 +259,15 @@ def test_fill_order_id_matches_order():
     f = Fill(order_id=o.id, side=BUY, quantity=10.0,
              price=100.0, cash_change=-1000.0, position_change=10.0)
     assert f.order_id == o.id
+
+
+def test_order_delete_attribute_raises():
+    o = Order(side=BUY, quantity=1.0, price=10.0)
+    with pytest.raises(AttributeError):
+        del o.price
+
+
+def test_fill_value_equality():
+    kwargs = dict(order_id="abc", side=BUY, quantity=1.0, price=10.0,
+                  cash_change=-10.0, position_change=1.0)
+    assert Fill(**kwargs) == Fill(**kwargs)
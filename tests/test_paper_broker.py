@@ -341,3 +341,39 @@ def test_execute_order_returns_fill_instance():
     result = broker.execute_order(buy_order(10.0, 100.0))
     from execution.order import Fill
     assert isinstance(result, Fill)
+
+
+# ===========================================================================
+# Part 10 — execute_market (order-free path)
+# ===========================================================================
+
+def test_execute_market_matches_execute_order():
+    via_order = PaperBroker(initial_cash=1000, slippage_pct=0.01)
+    via_market = PaperBroker(initial_cash=1000, slippage_pct=0.01)
+    f1 = via_order.execute_order(buy_order(5.0, 100.0))
+    f2 = via_market.execute_market(BUY, 5.0, 100.0)
+    assert f2.price == f1.price
+    assert f2.cash_change == f1.cash_change
+    assert via_market.cash == via_order.cash
+    assert f2.order_id is None
+
+
+def test_execute_market_sell_insufficient_position_raises():
+    broker = PaperBroker(initial_cash=1000)
+    with pytest.raises(ValueError):
+        broker.execute_market(SELL, 1.0, 100.0)
+
+
+def test_execute_market_unknown_side_raises():
+    broker = PaperBroker(initial_cash=1000)
+    with pytest.raises(ValueError):
+        broker.execute_market("SHORT", 1.0, 100.0)
+
+
+def test_fill_from_broker_equals_constructed_fill():
+    broker = PaperBroker(initial_cash=1000.0)
+    fill = broker.execute_market(BUY, 2, 100)
+    assert fill == Fill(order_id=None, side=BUY, quantity=2.0, price=100.0,
+                        cash_change=-200.0, position_change=2.0)
+    with pytest.raises(AttributeError):
+        fill.price = 1.0
@@ -443,3 +443,90 @@ def test_three_strategies_capital_split():
     )
     result = engine.run(candles)
     assert result["portfolio_equity"] == pytest.approx(3000.0)
+
+
+# ===========================================================================
+# Part 13 — reset()
+# ===========================================================================
+
+def test_reset_then_run_matches_fresh_engine():
+    candles = [make_candle(p) for p in (100.0, 120.0, 90.0, 110.0)]
+    engine = PortfolioEngine([AlwaysBuyHold, BuySellAlternate], initial_capital=2000)
+    engine.run(candles)
+    engine.reset(500)
+    fresh = PortfolioEngine([AlwaysBuyHold, BuySellAlternate], initial_capital=500)
+    assert engine.run(candles) == fresh.run(candles)
+
+
+def test_reset_invalid_capital_raises():
+    engine = PortfolioEngine([AlwaysFlat], initial_capital=1000)
+    with pytest.raises(ValueError):
+        engine.reset(0)
+
+
+def test_run_with_preextracted_closes_matches_run():
+    candles = [make_candle(p) for p in (100.0, 120.0, 90.0, 110.0)]
+    closes = [c["close"] for c in candles]
+    with_closes = PortfolioEngine([BuySellAlternate], 1000).run(candles, closes)
+    assert with_closes == PortfolioEngine([BuySellAlternate], 1000).run(candles)
+
+
+# ===========================================================================
+# Part 14 — run_vectorized()
+# ===========================================================================
+
+@pytest.mark.parametrize("strategies", [
+    [AlwaysFlat],
+    [AlwaysBuyHold],
+    [BuySellAlternate],
+    [AlwaysBuyHold, BuySellAlternate, AlwaysFlat],
+])
+def test_run_vectorized_matches_run(strategies):
+    candles = [make_candle(p) for p in (100.0, 120.0, 90.0, 110.0, 130.0)]
+    vectorized = PortfolioEngine(strategies, 3000).run_vectorized(candles)
+    assert vectorized == PortfolioEngine(strategies, 3000).run(candles)
+
+
+def test_run_vectorized_with_risk_manager_matches_run():
+    candles = [make_candle(p) for p in (100.0, 120.0, 90.0, 110.0)]
+    rm = RiskManager(max_position_pct=0.5)
+    vectorized = PortfolioEngine([BuySellAlternate], 1000,
+                                 risk_manager=rm).run_vectorized(candles)
+    expected = PortfolioEngine([BuySellAlternate], 1000,
+                               risk_manager=rm).run(candles)
+    assert vectorized == expected
+
+
+def test_run_curves_not_shared_between_runs():
+    engine = PortfolioEngine([AlwaysFlat], initial_capital=1000)
+    first = engine.run([make_candle(100.0)])["portfolio_equity_curve"]
+    second = engine.run([make_candle(100.0)])["portfolio_equity_curve"]
+    first.append(0.0)
+    assert second == pytest.approx([1000.0])
+
+
+# ===========================================================================
+# Part 15 — max_workers
+# ===========================================================================
+
+def test_threaded_run_matches_sequential():
+    candles = [make_candle(p) for p in (100.0, 120.0, 90.0, 110.0, 130.0)]
+    strategies = [AlwaysBuyHold, BuySellAlternate, AlwaysFlat]
+    threaded = PortfolioEngine(strategies, 3000, max_workers=3).run(candles)
+    assert threaded == PortfolioEngine(strategies, 3000).run(candles)
+
+
+def test_threaded_run_with_risk_manager_matches_sequential():
+    candles = [make_candle(p) for p in (100.0, 120.0, 90.0, 110.0, 130.0)]
+    strategies = [AlwaysBuyHold, BuySellAlternate, AlwaysFlat]
+    rm = RiskManager(max_position_pct=0.5)
+    threaded = PortfolioEngine(
+        strategies, 3000, risk_manager=rm, max_workers=3
+    ).run(candles)
+    sequential = PortfolioEngine(strategies, 3000, risk_manager=rm).run(candles)
+    assert threaded == sequential
+
+
+def test_max_workers_below_one_raises():
+    with pytest.raises(ValueError):
+        PortfolioEngine([AlwaysFlat], initial_capital=1000, max_workers=0)
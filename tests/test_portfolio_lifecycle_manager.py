@@ -484,3 +484,154 @@ def test_positive_returns_final_equity_greater_than_initial():
     manager = make_manager([AlwaysBuyHold], initial_capital=1000, interval=100)
     result = manager.run(candles)
     assert result["final_portfolio_equity"] > 1000.0
+
+
+# ===========================================================================
+# Part 14 — Engines reused across segments
+# ===========================================================================
+
+def test_duplicate_strategy_class_gets_independent_engines():
+    """The same class listed twice behaves like two separate strategies."""
+    candles = [make_candle(float(100 + i * 10)) for i in range(9)]
+    doubled = make_manager([AlwaysBuyHold, AlwaysBuyHold],
+                           initial_capital=1000, interval=3).run(candles)
+    single = make_manager([AlwaysBuyHold],
+                          initial_capital=1000, interval=3).run(candles)
+    assert doubled["equity_curve"] == pytest.approx(single["equity_curve"])
+
+
+# ===========================================================================
+# Part 15 — Ranking window
+# ===========================================================================
+
+class RecordingRankingEngine(MockRankingEngine):
+    """MockRankingEngine that records every window it is asked to rank."""
+    def __init__(self, strategies):
+        super().__init__(strategies)
+        self.windows = []
+
+    def run(self, candles):
+        self.windows.append((len(candles), list(candles), candles[-1], candles[1:3]))
+        return super().run(candles)
+
+
+def test_ranking_window_is_prefix_up_to_rebalance_step():
+    candles = [make_candle(float(100 + i)) for i in range(10)]
+    ranking_engine = RecordingRankingEngine([AlwaysFlat])
+    PortfolioLifecycleManager(
+        strategies=[AlwaysFlat],
+        initial_capital=1000,
+        ranking_engine=ranking_engine,
+        allocator=CapitalAllocator(mode="equal"),
+        rebalance_policy=RebalancePolicy(interval=4),
+    ).run(candles)
+    assert len(ranking_engine.windows) == 3
+    for step, (length, window, last, middle) in zip((0, 4, 8), ranking_engine.windows):
+        assert length == step + 1
+        assert window == candles[: step + 1]
+        assert last is candles[step]
+        assert middle == candles[: step + 1][1:3]
+
+
+class IncrementalRankingEngine(MockRankingEngine):
+    """Ranking engine exposing the incremental update()/reset() protocol."""
+    def __init__(self, strategies):
+        super().__init__(strategies)
+        self.seen = []
+        self.resets = 0
+
+    def reset(self):
+        self.resets += 1
+        self.seen = []
+
+    def update(self, new_candles):
+        self.seen.extend(new_candles)
+        return self.run(self.seen)
+
+
+def test_incremental_ranking_engine_fed_each_candle_once():
+    candles = [make_candle(float(100 + i)) for i in range(10)]
+    ranking_engine = IncrementalRankingEngine([AlwaysFlat])
+    manager = PortfolioLifecycleManager(
+        strategies=[AlwaysFlat],
+        initial_capital=1000,
+        ranking_engine=ranking_engine,
+        allocator=CapitalAllocator(mode="equal"),
+        rebalance_policy=RebalancePolicy(interval=4),
+    )
+    manager.run(candles)
+    manager.run(candles)
+    assert ranking_engine.resets == 2
+    assert ranking_engine.seen == candles[:9]
+
+
+class StatelessRankingEngine(RecordingRankingEngine):
+    stateless = True
+
+
+def test_stateless_ranking_engine_runs_once_per_run():
+    candles = [make_candle(float(100 + i)) for i in range(10)]
+    ranking_engine = StatelessRankingEngine([AlwaysFlat])
+    manager = PortfolioLifecycleManager(
+        strategies=[AlwaysFlat],
+        initial_capital=1000,
+        ranking_engine=ranking_engine,
+        allocator=CapitalAllocator(mode="equal"),
+        rebalance_policy=RebalancePolicy(interval=4),
+    )
+    result = manager.run(candles)
+    assert len(ranking_engine.windows) == 1
+    assert result["rebalance_steps"] == [0, 4, 8]
+
+
+# ===========================================================================
+# Part 16 — max_workers
+# ===========================================================================
+
+def test_threaded_segments_match_sequential():
+    candles = [make_candle(float(100 + (i % 7) * 5)) for i in range(20)]
+    strategies = [AlwaysFlat, AlwaysBuyHold]
+    threaded = PortfolioLifecycleManager(
+        strategies=strategies,
+        initial_capital=1000,
+        ranking_engine=MockRankingEngine(strategies),
+        allocator=CapitalAllocator(mode="equal"),
+        rebalance_policy=RebalancePolicy(interval=6),
+        max_workers=2,
+    )
+    try:
+        threaded_result = threaded.run(candles)
+    finally:
+        threaded.close()
+    sequential = make_manager(strategies, interval=6).run(candles)
+    assert threaded_result == sequential
+
+
+def test_context_manager_closes_pool():
+    candles = [make_candle(float(100 + (i % 7) * 5)) for i in range(20)]
+    strategies = [AlwaysFlat, AlwaysBuyHold]
+    with PortfolioLifecycleManager(
+        strategies=strategies,
+        initial_capital=1000,
+        ranking_engine=MockRankingEngine(strategies),
+        allocator=CapitalAllocator(mode="equal"),
+        rebalance_policy=RebalancePolicy(interval=6),
+        max_workers=2,
+    ) as manager:
+        manager.run(candles)
+        pool = manager._pool
+        assert pool is not None
+    assert manager._pool is None
+    assert pool._shutdown
+
+
+def test_max_workers_below_one_raises():
+    with pytest.raises(ValueError):
+        PortfolioLifecycleManager(
+            strategies=[AlwaysFlat],
+            initial_capital=1000,
+            ranking_engine=MockRankingEngine([AlwaysFlat]),
+            allocator=CapitalAllocator(mode="equal"),
+            rebalance_policy=RebalancePolicy(interval=5),
+            max_workers=0,
+        )
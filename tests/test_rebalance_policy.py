@@ -133,6 +133,13 @@ def test_interval100_does_not_trigger_at_99():
     assert p.should_rebalance(99) is False
 
 
+def test_power_of_two_interval_matches_modulo():
+    for interval in (2, 8, 16, 32):
+        p = RebalancePolicy(interval=interval)
+        for step in range(200):
+            assert p.should_rebalance(step) is (step % interval == 0)
+
+
 # ===========================================================================
 # Part 5 — Deterministic
 # ===========================================================================
@@ -162,3 +169,13 @@ def test_should_rebalance_does_not_mutate_step():
     step = 10
     p.should_rebalance(step)
     assert step == 10  # trivially true, but documents intent
+
+
+# ===========================================================================
+# Part 7 — schedule()
+# ===========================================================================
+
+@pytest.mark.parametrize("interval,n", [(1, 5), (3, 10), (5, 5), (7, 3), (4, 0)])
+def test_schedule_matches_should_rebalance(interval, n):
+    p = RebalancePolicy(interval=interval)
+    assert list(p.schedule(n)) == [i for i in range(n) if p.should_rebalance(i)]
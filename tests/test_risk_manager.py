@@ -216,3 +216,20 @@ def test_deterministic_same_inputs_same_result():
     assert r1.quantity == pytest.approx(r2.quantity)
     assert r1.side == r2.side
     assert r1.price == pytest.approx(r2.price)
+
+
+# ===========================================================================
+# Part 7 — adjust_buy_qty
+# ===========================================================================
+
+def test_adjust_buy_qty_matches_adjust_order():
+    rm = RiskManager(max_position_pct=0.5)
+    for quantity, equity in ((10.0, 1000.0), (3.0, 1000.0), (10.0, 0.0)):
+        expected = rm.adjust_order(buy_order(quantity, 100.0), equity=equity).quantity
+        assert rm.adjust_buy_qty(quantity, 100.0, equity) == expected
+
+
+def test_adjust_buy_qty_negative_equity_raises():
+    rm = RiskManager(max_position_pct=0.5)
+    with pytest.raises(ValueError):
+        rm.adjust_buy_qty(10.0, 100.0, -1.0)
@@ -756,3 +756,31 @@ def test_single_fold_robustness_score_equals_fold_score():
     assert result["robustness_score"] == pytest.approx(
         result["fold_scores"][0], rel=1e-12
     )
+
+
+# ===========================================================================
+# Part 13 — worker processes give the same result
+# ===========================================================================
+
+def test_max_workers_matches_in_process():
+    kwargs = dict(train_size=4, test_size=4, step_size=2,
+                  simulations=20, seed=5)
+    serial = RobustnessEngine(AlwaysLongStrategy, CANDLES_8 * 2, **kwargs).run()
+    pooled = RobustnessEngine(
+        AlwaysLongStrategy, CANDLES_8 * 2, max_workers=2, **kwargs
+    ).run()
+    assert pooled == serial
+
+
+def test_max_workers_with_local_strategy_falls_back_in_process():
+    class LocalLong(AlwaysLongStrategy):
+        pass
+
+    kwargs = dict(train_size=4, test_size=4, step_size=2,
+                  simulations=20, seed=5)
+    serial = RobustnessEngine(AlwaysLongStrategy, CANDLES_8 * 2, **kwargs).run()
+    local = RobustnessEngine(
+        LocalLong, CANDLES_8 * 2, max_workers=2, **kwargs
+    ).run()
+    assert local == serial
+
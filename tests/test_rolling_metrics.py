@@ -210,3 +210,11 @@ def test_no_mutation():
     rm = RollingMetrics(curve)
     rm.rolling_volatility(2)
     assert curve == original
+
+
+def test_rolling_sharpe_and_volatility_matches_separate_calls():
+    curve = [100.0, 102.0, 101.0, 105.0, 103.0, 108.0, 107.0, 107.0, 110.0]
+    rm = RollingMetrics(curve)
+    sharpe, vol = rm.rolling_sharpe_and_volatility(3)
+    assert sharpe == rm.rolling_sharpe(3)
+    assert vol == rm.rolling_volatility(3)
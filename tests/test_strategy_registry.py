@@ -195,6 +195,16 @@ def test_list_strategies_returns_new_list_each_call():
     assert registry.list_strategies() == ["alpha"]
 
 
+def test_list_strategies_reflects_changes_after_previous_call():
+    registry = StrategyRegistry()
+    registry.register("alpha", StrategyAlpha)
+    assert registry.list_strategies() == ["alpha"]
+    registry.register("beta", StrategyBeta)
+    assert registry.list_strategies() == ["alpha", "beta"]
+    registry.unregister("alpha")
+    assert registry.list_strategies() == ["beta"]
+
+
 # ===========================================================================
 # Part 6 — No global state (instances are independent)
 # ===========================================================================
@@ -46,7 +46,7 @@ Raises ValueError for:
 import math
 import pytest
 
-from research.walk_forward_engine import walk_forward_analysis
+from research.walk_forward_engine import validate_fold_params, walk_forward_analysis
 from app.backtester.engine import Backtester
 
 # ---------------------------------------------------------------------------
@@ -653,3 +653,14 @@ def test_raises_when_empty_candles():
     with pytest.raises(ValueError):
         walk_forward_analysis(AlwaysLongStrategy, [],
                               train_size=4, test_size=3, step_size=1)
+
+
+def test_validate_fold_params_matches_walk_forward_errors():
+    candles = [make_candle(f"2024-01-{i+1:02d}", float(i+1)) for i in range(5)]
+    for sizes in ((1, 2, 1), (2, 1, 1), (2, 2, 0), (4, 3, 1)):
+        with pytest.raises(ValueError) as direct:
+            validate_fold_params(len(candles), *sizes)
+        with pytest.raises(ValueError) as full:
+            walk_forward_analysis(AlwaysLongStrategy, candles, *sizes)
+        assert str(direct.value) == str(full.value)
+    validate_fold_params(len(candles), 2, 3, 1)  # one window fits